@@ -0,0 +1,11 @@
+from .llm_cache import CacheBackend, InMemoryLRU, LLMCache, llm_cache
+from .semantic_cache import SemanticCache, semantic_cache
+
+__all__ = [
+    "CacheBackend",
+    "InMemoryLRU",
+    "LLMCache",
+    "llm_cache",
+    "SemanticCache",
+    "semantic_cache",
+]
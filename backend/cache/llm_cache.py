@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Protocol
+
+
+class CacheBackend(Protocol):
+    """Interface for async key/value stores used to cache LLM responses"""
+
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ...
+
+    async def delete(self, key: str) -> None:
+        ...
+
+    async def clear(self) -> None:
+        ...
+
+
+class InMemoryLRU:
+    """In-process LRU cache with per-entry expiry"""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[Any]:
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        async with self._lock:
+            expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl)
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        async with self._lock:
+            self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        async with self._lock:
+            self._entries.clear()
+
+
+def hash_context(context: Any) -> str:
+    """Order-independent hash of a research context (list of strings or a string)"""
+    if isinstance(context, (list, tuple, set)):
+        payload = json.dumps(sorted(str(item) for item in context))
+    else:
+        payload = str(context)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def make_cache_key(fn: str, key_payload: Dict[str, Any]) -> str:
+    """Build a stable cache key from the function name and its inputs"""
+    payload = json.dumps({"fn": fn, **key_payload}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Memoizes awaitable LLM calls in a cache backend and tracks hit/miss counts"""
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: float = 3600):
+        self.backend = backend or InMemoryLRU(ttl=ttl)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def cached_call(
+        self,
+        fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        key_payload: Dict[str, Any],
+        on_hit: Optional[Callable[[], Awaitable[None]]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Return the cached result for `key_payload`, calling `fn` on a miss.
+        `on_hit` is awaited when the result is served from the cache.
+        """
+        key = make_cache_key(getattr(fn, "__name__", repr(fn)), key_payload)
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            if on_hit is not None:
+                await on_hit()
+            return cached
+
+        self.misses += 1
+        result = await fn(*args, **kwargs)
+        if result is not None:
+            await self.backend.set(key, result, ttl=self.ttl)
+        return result
+
+
+# Shared across report runs so retried sessions can reuse earlier responses
+llm_cache = LLMCache()
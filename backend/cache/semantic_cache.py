@@ -0,0 +1,103 @@
+import asyncio
+import re
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+
+# Capitalized words, acronyms and tokens containing digits (e.g. "CPC", "Python", "GPT4")
+_ENTITY_PATTERN = re.compile(r"\b(?:[A-Z][\w-]*|\w*\d\w*)\b")
+
+
+def extract_entities(query: str) -> Set[str]:
+    """Cheap named-entity heuristic used to guard against near-miss cache hits"""
+    return {token.lower() for token in _ENTITY_PATTERN.findall(query)}
+
+
+class SemanticCache:
+    """
+    Caches research results keyed by query embedding so paraphrased queries
+    can reuse an earlier research run. Entries only match lookups with the same
+    scope, a hash of every non-query input that shapes the research, and
+    expire after `ttl` seconds so stale web research is not reused.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 256, ttl: float = 3600):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._vectors: Optional[np.ndarray] = None
+        self._queries: List[str] = []
+        self._scopes: List[str] = []
+        self._expires_at: List[float] = []
+        self._entries: List[Dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    async def lookup(self, query: str, embedding: List[float], scope: str = "") -> Optional[Dict[str, Any]]:
+        """Return the cached entry for the most similar query in the scope above the threshold"""
+        async with self._lock:
+            if self._vectors is None or not self._queries:
+                return None
+
+            vector = self._normalize(embedding)
+            if vector.shape[0] != self._vectors.shape[1]:
+                return None
+
+            in_scope = np.fromiter((s == scope for s in self._scopes), dtype=bool, count=len(self._scopes))
+            in_scope &= np.asarray(self._expires_at) >= time.monotonic()
+            if not in_scope.any():
+                return None
+
+            scores = np.where(in_scope, self._vectors @ vector, -np.inf)
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+
+            # Reject the hit if the query names an entity the cached query does not
+            if not extract_entities(query) <= extract_entities(self._queries[best]):
+                return None
+
+            return self._entries[best]
+
+    async def store(self, query: str, embedding: List[float], entry: Dict[str, Any], scope: str = "") -> None:
+        """Add a research result to the cache, dropping expired entries and evicting the oldest when full"""
+        async with self._lock:
+            now = time.monotonic()
+            vector = self._normalize(embedding)[np.newaxis, :]
+            if self._vectors is None or self._vectors.shape[1] != vector.shape[1]:
+                self._vectors = vector
+                self._queries = [query]
+                self._scopes = [scope]
+                self._expires_at = [now + self.ttl]
+                self._entries = [entry]
+                return
+
+            live = [i for i, expires_at in enumerate(self._expires_at) if expires_at >= now]
+            if len(live) < len(self._expires_at):
+                self._vectors = self._vectors[live]
+                self._queries = [self._queries[i] for i in live]
+                self._scopes = [self._scopes[i] for i in live]
+                self._expires_at = [self._expires_at[i] for i in live]
+                self._entries = [self._entries[i] for i in live]
+
+            self._vectors = np.vstack([self._vectors, vector])
+            self._queries.append(query)
+            self._scopes.append(scope)
+            self._expires_at.append(now + self.ttl)
+            self._entries.append(entry)
+            if len(self._queries) > self.max_entries:
+                self._vectors = self._vectors[1:]
+                self._queries.pop(0)
+                self._scopes.pop(0)
+                self._expires_at.pop(0)
+                self._entries.pop(0)
+
+
+# Shared across report runs so paraphrased queries hit earlier research
+semantic_cache = SemanticCache()
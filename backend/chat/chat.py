@@ -44,7 +44,7 @@ class ChatAgentWithMemory:
             llm_init_kwargs["temperature"] = 0.35
             llm_init_kwargs["max_tokens"] = cfg.smart_token_limit
 
-        provider = get_llm(**llm_init_kwargs).llm
+        self.llm = get_llm(**llm_init_kwargs).llm
 
         # If vector_store is not initialized, process documents and add to vector_store
         if not self.vector_store:
@@ -58,14 +58,15 @@ class ChatAgentWithMemory:
             self.vector_store = InMemoryVectorStore(self.embedding)
             self.vector_store.add_texts(documents)
 
-        # Create the React Agent Graph with the configured provider
-        graph = create_react_agent(
-            provider,
+        return self.build_graph()
+
+    def build_graph(self):
+        """Create the React Agent Graph with the configured provider and its own chat memory"""
+        return create_react_agent(
+            self.llm,
             tools=[self.vector_store_tool(self.vector_store)],
             checkpointer=MemorySaver()
         )
-        
-        return graph
     
     def vector_store_tool(self, vector_store) -> Tool:
         """Create Vector Store Tool"""
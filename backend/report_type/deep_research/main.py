@@ -1,5 +1,5 @@
 from gpt_researcher import GPTResearcher
-from backend.utils import write_md_to_pdf,write_md_to_word, write_text_to_md
+from backend.utils import write_md_to_pdf, write_text_to_md
 import asyncio
 
 
@@ -27,12 +27,20 @@ async def main(task: str):
     report = await researcher.write_report()
     
     # Save in multiple formats with proper table and code styling (similar to multi-modal)
-    await write_text_to_md(report, "deep_research_report")  # raw markdown
-    await write_md_to_word(report, "deep_research_report")  # docx version
-    await write_md_to_pdf(report, "deep_research_report")   # pdf version with styling
+    # write_md_to_pdf renders the docx version on its way to the pdf, so calling
+    # write_md_to_word as well would only race on the same .docx file
+    await asyncio.gather(
+        write_text_to_md(report, "deep_research_report"),  # raw markdown
+        write_md_to_pdf(report, "deep_research_report"),   # docx + pdf version with styling
+    )
     
     print(f"\nFinal Report Generated in MD, DOCX, and PDF formats:\n{report}")
 
 if __name__ == "__main__":
     query = "What are the most effective ways for beginners to start investing?"
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main(query))
\ No newline at end of file
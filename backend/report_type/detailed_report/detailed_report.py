@@ -1,8 +1,50 @@
 import asyncio
-from typing import List, Dict, Set, Optional, Any
+import hashlib
+import itertools
+import logging
+from collections import OrderedDict
+from typing import List, Dict, Set, Optional, Any, Callable, Tuple
 from fastapi import WebSocket
 
 from gpt_researcher import GPTResearcher
+from gpt_researcher.actions import (
+    extract_headers,
+    extract_headers_and_sections,
+    iter_report_chunks,
+    table_of_contents_from_headers,
+)
+from backend.cache import llm_cache, semantic_cache
+from backend.cache.llm_cache import hash_context, make_cache_key
+from backend.utils import send_report_stream
+from backend.server.log_batcher import LogBatcher
+
+logger = logging.getLogger(__name__)
+
+
+_PARSE_CACHE_SIZE = 256
+# Parsed markdown keyed only on (parser, content digest), so the cache never holds the report text itself
+_parse_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+
+
+def _cached_parse(kind: str, parse: Callable[[str], Any], text: str) -> Any:
+    key = (kind, hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest())
+    if key in _parse_cache:
+        _parse_cache.move_to_end(key)
+        return _parse_cache[key]
+    result = _parse_cache[key] = parse(text)
+    if len(_parse_cache) > _PARSE_CACHE_SIZE:
+        _parse_cache.popitem(last=False)
+    return result
+
+
+def cached_extract_headers(text: str) -> List[Dict]:
+    """extract_headers memoized by content hash"""
+    return _cached_parse("headers", extract_headers, text)
+
+
+def cached_extract_headers_and_sections(text: str) -> Tuple[List[Dict], List[Dict]]:
+    """extract_headers_and_sections memoized by content hash"""
+    return _cached_parse("headers_and_sections", extract_headers_and_sections, text)
 
 
 class DetailedReport:
@@ -22,6 +64,7 @@ class DetailedReport:
         complement_source_urls: bool = False,
         mcp_configs=None,
         mcp_strategy=None,
+        max_concurrent_subtopics: int = 4,
     ):
         self.query = query
         self.report_type = report_type
@@ -32,9 +75,11 @@ class DetailedReport:
         self.config_path = config_path
         self.tone = tone
         self.websocket = websocket
+        self.log_batcher = LogBatcher(self.websocket) if self.websocket else None
         self.subtopics = subtopics
         self.headers = headers or {}
         self.complement_source_urls = complement_source_urls
+        self.max_concurrent_subtopics = max(1, max_concurrent_subtopics)
         
         # Initialize researcher with optional MCP parameters
         gpt_researcher_params = {
@@ -58,11 +103,30 @@ class DetailedReport:
             gpt_researcher_params["mcp_strategy"] = mcp_strategy
             
         self.gpt_researcher = GPTResearcher(**gpt_researcher_params)
+        # Every input besides the query that changes the research, so cached work
+        # is only reused by runs with the same sources, restrictions, tone and config
+        self._scope = make_cache_key("detailed_report", {
+            "report_source": self.report_source,
+            "source_urls": sorted(self.source_urls or []),
+            "document_urls": sorted(self.document_urls or []),
+            "query_domains": sorted(self.query_domains or []),
+            "complement_source_urls": self.complement_source_urls,
+            "tone": str(self.tone),
+            "headers": self.headers,
+            "mcp_configs": mcp_configs,
+            "mcp_strategy": mcp_strategy,
+            "config_path": self.config_path,
+            "config": vars(self.gpt_researcher.cfg),
+        })
         self.existing_headers: List[Dict] = []
         self.global_context: List[str] = []
+        self._context_set: Set[str] = set()
         self.global_written_sections: List[str] = []
-        self.global_urls: Set[str] = set(
-            self.source_urls) if self.source_urls else set()
+        # Replaced by the researcher's visited URLs once the initial research has run
+        self.global_urls: Set[str] = set()
+        # In-flight and completed work shared by the subtopics of this run
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._draft_titles_cache: Dict[tuple, asyncio.Task] = {}
 
     async def run(self) -> str:
         """
@@ -87,13 +151,16 @@ class DetailedReport:
         report_introduction = await self.gpt_researcher.write_introduction()
         
         # Generate all subtopic reports (silently - no streaming)
-        _, report_body = await self._generate_subtopic_reports(subtopics)
+        cache_hits, cache_misses = llm_cache.hits, llm_cache.misses
+        subtopic_reports, report_body = await self._generate_subtopic_reports(subtopics)
+        cache_hits, cache_misses = llm_cache.hits - cache_hits, llm_cache.misses - cache_misses
         
         # Update visited URLs
         self.gpt_researcher.visited_urls.update(self.global_urls)
         
         # Construct the final detailed report (silently - no streaming)
-        report = await self._construct_detailed_report(report_introduction, report_body)
+        report_chunks = await self._construct_detailed_report(report_introduction, subtopic_reports, report_body)
+        report = "".join(report_chunks)
         
         # Restore websocket and verbose settings
         self.gpt_researcher.websocket = original_ws
@@ -101,21 +168,54 @@ class DetailedReport:
         
         # NOW send ONLY the final complete report to frontend (matching MultiAgentReport pattern)
         if self.websocket:
-            await self.websocket.send_json({
+            await self.log_batcher.send_json({
                 "type": "logs",
-                "output": "✅ Detailed research report generated successfully!"
+                "output": f"♻️ LLM cache: {cache_hits} hits, {cache_misses} misses"
             })
-            await self.websocket.send_json({
-                "type": "report",
-                "output": report
+            await self.log_batcher.send_json({
+                "type": "logs",
+                "output": "✅ Detailed research report generated successfully!"
             })
+            await send_report_stream(self.log_batcher, report_chunks)
+            # Wait for the writer to drain so the report is sent before returning
+            await self.log_batcher.close()
         
         return report
 
     async def _initial_research(self) -> None:
         """Conduct initial research - this can show progress"""
-        await self.gpt_researcher.conduct_research()
-        self.global_context = self.gpt_researcher.context
+        query_embedding = None
+        try:
+            embeddings = self.gpt_researcher.memory.get_embeddings()
+            query_embedding = await embeddings.aembed_query(self.query)
+        except Exception as e:
+            logger.warning("Skipping semantic cache, failed to embed query: %s", e)
+
+        cached = None
+        if query_embedding is not None:
+            cached = await semantic_cache.lookup(self.query, query_embedding, scope=self._scope)
+
+        if cached:
+            self.gpt_researcher.context = cached["context"]
+            self.gpt_researcher.visited_urls.update(cached["visited_urls"])
+            self.gpt_researcher.agent = self.gpt_researcher.agent or cached["agent"]
+            self.gpt_researcher.role = self.gpt_researcher.role or cached["role"]
+            if self.websocket:
+                await self.log_batcher.send_json({
+                    "type": "logs",
+                    "output": "♻️ Reusing research from a similar previous query"
+                })
+        else:
+            await self.gpt_researcher.conduct_research()
+            if query_embedding is not None:
+                await semantic_cache.store(self.query, query_embedding, {
+                    "context": self.gpt_researcher.context,
+                    "visited_urls": set(self.gpt_researcher.visited_urls),
+                    "agent": self.gpt_researcher.agent,
+                    "role": self.gpt_researcher.role,
+                }, scope=self._scope)
+
+        self._add_context(self.gpt_researcher.context)
         self.global_urls = self.gpt_researcher.visited_urls
 
     async def _get_all_subtopics(self) -> List[Dict]:
@@ -132,22 +232,52 @@ class DetailedReport:
         return all_subtopics
 
     async def _generate_subtopic_reports(self, subtopics: List[Dict]) -> tuple:
-        """Generate reports for all subtopics silently"""
+        """Generate reports for all subtopics concurrently and silently"""
         subtopic_reports = []
-        subtopics_report_body = ""
+        report_parts: List[str] = []
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_subtopics)
+        # Every subtopic starts from the URLs known before the fan-out
+        known_urls = frozenset(self.global_urls)
 
-        for subtopic in subtopics:
-            result = await self._get_subtopic_report(subtopic)
+        async def _bounded(subtopic: Dict) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._get_subtopic_report(subtopic, known_urls)
+
+        results = await asyncio.gather(*[_bounded(subtopic) for subtopic in subtopics])
+
+        # Fold each subtopic's results into the global state in subtopic order
+        for result in results:
+            self._merge_subtopic_result(result)
             if result["report"]:
                 subtopic_reports.append(result)
-                subtopics_report_body += f"\n\n\n{result['report']}"
+                report_parts.append(f"\n\n\n{result['report']}")
+        self.global_urls.update(itertools.chain.from_iterable(
+            result["visited_urls"] for result in results
+        ))
+
+        return subtopic_reports, "".join(report_parts)
+
+    def _merge_subtopic_result(self, result: Dict[str, Any]) -> None:
+        """Apply the state produced by a single subtopic report to the global state"""
+        self.global_written_sections.extend(result["written_sections"])
+        self._add_context(result["context"])
+        self.existing_headers.append(result["headers"])
 
-        return subtopic_reports, subtopics_report_body
+    def _add_context(self, context: Any) -> None:
+        """Append unseen context entries to the global context, keeping insertion order"""
+        if isinstance(context, str):
+            context = [context] if context else []
+        new_context = [c for c in context if c not in self._context_set]
+        self._context_set.update(new_context)
+        self.global_context.extend(new_context)
 
-    async def _get_subtopic_report(self, subtopic: Dict) -> Dict[str, str]:
+    async def _get_subtopic_report(self, subtopic: Dict, known_urls: frozenset = frozenset()) -> Dict[str, Any]:
         """
         Generate a single subtopic report.
         CRITICAL: This runs completely silently - no streaming to frontend.
+        Subtopics run concurrently, so the global state is not mutated here;
+        the produced context, sections, URLs and headers are returned instead.
         """
         current_subtopic_task = subtopic.get("task")
         
@@ -163,7 +293,7 @@ class DetailedReport:
             headers=self.headers,
             parent_query=self.query,
             subtopics=self.subtopics,
-            visited_urls=self.global_urls,
+            visited_urls=set(known_urls),
             agent=self.gpt_researcher.agent,
             role=self.gpt_researcher.role,
             tone=self.tone,
@@ -171,45 +301,95 @@ class DetailedReport:
             source_urls=self.source_urls
         )
 
-        subtopic_assistant.context = list(set(self.global_context))
-        
+        subtopic_assistant.context = self.global_context
+        # Subtopics requesting the same page concurrently wait on a single fetch
+        subtopic_assistant.scraper_manager.in_flight = self._in_flight
+        model = subtopic_assistant.cfg.smart_llm_model
+
         # Conduct research silently
-        await subtopic_assistant.conduct_research()
+        async def conduct_research() -> Dict[str, Any]:
+            await subtopic_assistant.conduct_research()
+            return {
+                "context": subtopic_assistant.context,
+                "visited_urls": set(subtopic_assistant.visited_urls),
+            }
+
+        research = await llm_cache.cached_call(conduct_research, key_payload={
+            "scope": self._scope,
+            "model": model,
+            "query": current_subtopic_task,
+            "parent_query": self.query,
+            "known_urls": sorted(known_urls),
+            "context_hash": hash_context(subtopic_assistant.context),
+        })
+        subtopic_assistant.context = research["context"]
+        subtopic_assistant.visited_urls.update(research["visited_urls"])
+        context_hash = hash_context(subtopic_assistant.context)
 
         # Get draft section titles
-        draft_section_titles = await subtopic_assistant.get_draft_section_titles(current_subtopic_task)
+        draft_titles_key = (current_subtopic_task, context_hash)
+        if draft_titles_key not in self._draft_titles_cache:
+            self._draft_titles_cache[draft_titles_key] = asyncio.create_task(llm_cache.cached_call(
+                subtopic_assistant.get_draft_section_titles, current_subtopic_task,
+                key_payload={
+                    "scope": self._scope,
+                    "model": model,
+                    "query": current_subtopic_task,
+                    "context_hash": context_hash,
+                },
+            ))
+        draft_section_titles = await self._draft_titles_cache[draft_titles_key]
 
         if not isinstance(draft_section_titles, str):
             draft_section_titles = str(draft_section_titles)
 
-        parse_draft_section_titles = self.gpt_researcher.extract_headers(draft_section_titles)
+        parse_draft_section_titles = cached_extract_headers(draft_section_titles)
         parse_draft_section_titles_text = [header.get(
             "text", "") for header in parse_draft_section_titles]
 
-        relevant_contents = await subtopic_assistant.get_similar_written_contents_by_draft_section_titles(
-            current_subtopic_task, parse_draft_section_titles_text, self.global_written_sections
+        written_sections = list(self.global_written_sections)
+        relevant_contents = await llm_cache.cached_call(
+            subtopic_assistant.get_similar_written_contents_by_draft_section_titles,
+            current_subtopic_task, parse_draft_section_titles_text, written_sections,
+            key_payload={
+                "scope": self._scope,
+                "model": model,
+                "query": current_subtopic_task,
+                "draft_section_titles": parse_draft_section_titles_text,
+                "context_hash": hash_context(written_sections),
+            },
         )
 
-        # Generate subtopic report silently (no streaming)
-        subtopic_report = await subtopic_assistant.write_report(self.existing_headers, relevant_contents)
-
-        # Update global state with subtopic results
-        self.global_written_sections.extend(self.gpt_researcher.extract_sections(subtopic_report))
-        self.global_context = list(set(subtopic_assistant.context))
-        self.global_urls.update(subtopic_assistant.visited_urls)
+        # Generate subtopic report silently (no streaming).
+        # The written text is never cached, every run writes its own report.
+        subtopic_report = await subtopic_assistant.write_report(
+            list(self.existing_headers), relevant_contents
+        )
 
-        self.existing_headers.append({
-            "subtopic task": current_subtopic_task,
-            "headers": self.gpt_researcher.extract_headers(subtopic_report),
-        })
+        # One markdown parse for both the headers and the written sections
+        report_headers, report_sections = cached_extract_headers_and_sections(subtopic_report)
 
-        return {"topic": subtopic, "report": subtopic_report}
+        return {
+            "topic": subtopic,
+            "report": subtopic_report,
+            "written_sections": report_sections,
+            "context": subtopic_assistant.context,
+            "visited_urls": subtopic_assistant.visited_urls,
+            "headers": {
+                "subtopic task": current_subtopic_task,
+                "headers": report_headers,
+            },
+        }
 
-    async def _construct_detailed_report(self, introduction: str, report_body: str) -> str:
-        """Construct the final detailed report from all components"""
-        toc = self.gpt_researcher.table_of_contents(report_body)
+    async def _construct_detailed_report(
+        self, introduction: str, subtopic_reports: List[Dict[str, Any]], report_body: str
+    ) -> List[str]:
+        """Construct the final detailed report from all components, as ordered chunks"""
+        # Built from the headers already extracted per subtopic, no second markdown parse
+        toc = table_of_contents_from_headers(result["headers"]["headers"] for result in subtopic_reports)
         conclusion = await self.gpt_researcher.write_report_conclusion(report_body)
         conclusion_with_references = self.gpt_researcher.add_references(
             conclusion, self.gpt_researcher.visited_urls)
-        report = f"{introduction}\n\n{toc}\n\n{report_body}\n\n{conclusion_with_references}"
-        return report
\ No newline at end of file
+        return list(iter_report_chunks(
+            introduction, toc, (result["report"] for result in subtopic_reports), conclusion_with_references
+        ))
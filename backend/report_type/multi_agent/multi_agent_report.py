@@ -1,8 +1,13 @@
 from fastapi import WebSocket
 from typing import Any, List, Dict
+import hashlib
+import itertools
+import orjson
 
 from multi_agents.agents import ChiefEditorAgent
-from backend.utils import write_md_to_word, write_md_to_pdf, write_text_to_md
+from backend.utils import write_md_to_word, write_md_to_pdf, write_text_to_md, send_report_stream
+from backend.server.log_batcher import LogBatcher
+from backend.cache import llm_cache
 import sys
 import os
 
@@ -34,6 +39,7 @@ class MultiAgentReport:
         self.websocket = websocket
         self.headers = headers or {}
         self.visited_urls = set()
+        self.log_batcher = LogBatcher(self.websocket) if self.websocket else None
         
         # Configure multi-agent parameters
         self.agent_config = {
@@ -44,6 +50,19 @@ class MultiAgentReport:
             "guidelines": [],
             "verbose": True
         }
+        # Stable identity of the task and every input that shapes it, used to cache the whole multi-agent run
+        self._agent_config_hash = hashlib.blake2b(
+            orjson.dumps({
+                "agent_config": self.agent_config,
+                "tone": str(self.tone),
+                "report_source": self.report_source,
+                "source_urls": sorted(self.source_urls or []),
+                "document_urls": sorted(self.document_urls or []),
+                "query_domains": sorted(self.query_domains or []),
+                "headers": self.headers,
+            }, option=orjson.OPT_SORT_KEYS, default=str),
+            digest_size=16,
+        ).hexdigest()
         
         # Initialize the chief editor agent
         self.chief_editor = ChiefEditorAgent(
@@ -65,25 +84,39 @@ class MultiAgentReport:
             if type_str == "agent":
                 agent_info = f"[{step.upper()}] "
             
-            await websocket.send_json({
+            message = {
                 "type": "logs",
                 "output": f"{agent_info}{content}"
-            })
+            }
+            # Route through the single writer so concurrent agents never interleave sends
+            if self.log_batcher and websocket is self.websocket:
+                self.log_batcher.add(message)
+            else:
+                await websocket.send_json(message)
         
+    async def _log_cache_hit(self):
+        if self.websocket:
+            await self.log_batcher.send_json({
+                "type": "logs",
+                "output": "♻️ Reused cached report from an identical multi-agent run"
+            })
+
     async def run(self) -> str:
         """Run the multi-agent research process and return the final report"""
         # Send initial status to frontend
         if self.websocket:
-            await self.websocket.send_json({
+            await self.log_batcher.send_json({
                 "type": "logs",
                 "output": "🤖 Initializing multi-agent research team..."
             })
         
         try:
             # Execute the multi-agent workflow
-            result = await self.graph.ainvoke({
-                "task": self.agent_config
-            })
+            result = await llm_cache.cached_call(
+                self.graph.ainvoke, {"task": self.agent_config},
+                key_payload={"agent_config": self._agent_config_hash},
+                on_hit=self._log_cache_hit,
+            )
             
             # Extract the final report from the result - check multiple possible keys
             final_report = result.get("report", "")
@@ -93,13 +126,10 @@ class MultiAgentReport:
             if not final_report:
                 # If still no report, try to construct it from the research state
                 if "research_data" in result:
-                    sections = []
-                    for section in result.get("research_data", []):
-                        if isinstance(section, dict):
-                            for key, value in section.items():
-                                sections.append(str(value))
-                        else:
-                            sections.append(str(section))
+                    sections = list(itertools.chain.from_iterable(
+                        map(str, section.values()) if isinstance(section, dict) else (str(section),)
+                        for section in result.get("research_data", [])
+                    ))
                     
                     # Build a basic report structure
                     title = result.get("title", "Research Report")
@@ -108,23 +138,25 @@ class MultiAgentReport:
                     table_of_contents = result.get("table_of_contents", "")
                     sources = result.get("sources", [])
                     
-                    final_report = f"""# {title}
-
-## Table of Contents
-{table_of_contents}
-
-## Introduction
-{introduction}
-
-## Research Findings
-{chr(10).join(sections)}
-
-## Conclusion
-{conclusion}
-
-## References
-{chr(10).join(f"- {source}" for source in sources)}
-"""
+                    final_report = "\n".join([
+                        f"# {title}",
+                        "",
+                        "## Table of Contents",
+                        str(table_of_contents),
+                        "",
+                        "## Introduction",
+                        str(introduction),
+                        "",
+                        "## Research Findings",
+                        "\n".join(sections),
+                        "",
+                        "## Conclusion",
+                        str(conclusion),
+                        "",
+                        "## References",
+                        "\n".join(f"- {source}" for source in sources),
+                        "",
+                    ])
             
             # Update visited URLs from research
             if "visited_urls" in result:
@@ -132,16 +164,15 @@ class MultiAgentReport:
             
             # Send the final report to the frontend
             if self.websocket:
-                await self.websocket.send_json({
+                await self.log_batcher.send_json({
                     "type": "logs",
                     "output": "✅ Multi-agent research completed successfully!"
                 })
                 
                 # Send the final report to be displayed in the research report section
-                await self.websocket.send_json({
-                    "type": "report",
-                    "output": final_report
-                })
+                await send_report_stream(self.log_batcher, final_report)
+                # Wait for the writer to drain so the report is sent before returning
+                await self.log_batcher.close()
             
             # Return the final report
             return final_report
@@ -149,10 +180,11 @@ class MultiAgentReport:
         except Exception as e:
             error_message = f"❌ Error in multi-agent research: {str(e)}"
             if self.websocket:
-                await self.websocket.send_json({
+                await self.log_batcher.send_json({
                     "type": "logs",
                     "output": error_message
                 })
+                await self.log_batcher.close()
             raise e
         
     def get_source_urls(self):
@@ -1,11 +1,25 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
+import copy
+import functools
 import logging
-import json
+import uuid
+import orjson
 from backend.chat.chat import ChatAgentWithMemory
 
 logger = logging.getLogger(__name__)
 
+# Payloads above this size are parsed in a worker thread
+LARGE_PAYLOAD_BYTES = 16 * 1024
+
+
+async def parse_message(data: str):
+    """Parse a JSON message without blocking the event loop on large payloads"""
+    if len(data) > LARGE_PAYLOAD_BYTES:
+        return await asyncio.to_thread(orjson.loads, data)
+    return orjson.loads(data)
+
 app = FastAPI()
 
 # Add CORS middleware
@@ -17,6 +31,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@functools.lru_cache(maxsize=1)
+def _chat_agent_template() -> ChatAgentWithMemory:
+    """Build the chat agent once; its LLM, embeddings and vector store are shared"""
+    return ChatAgentWithMemory(report="Sample report", config_path="path/to/config", headers={})
+
+
+def make_chat_agent(research_mode: str = "default") -> ChatAgentWithMemory:
+    """
+    Cheap per-connection chat agent with its own graph and conversation thread.
+    The graph's checkpointer holds the chat memory, so it is never shared and
+    is released with the agent when the connection goes away.
+    """
+    chat_agent = copy.copy(_chat_agent_template())
+    chat_agent.graph = chat_agent.build_graph()
+    chat_agent.chat_config = {"configurable": {"thread_id": str(uuid.uuid4())}}
+    chat_agent.research_mode = research_mode
+    return chat_agent
+
+
 @app.get("/")
 async def read_root():
     return {"message": "Welcome to GPT Researcher"}
@@ -28,26 +61,17 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             data = await websocket.receive_text()
+            research_mode = "default"
+            chat_message = data
             try:
-                message = json.loads(data)
+                message = await parse_message(data)
                 if isinstance(message, dict):
-                    # Initialize chat agent based on research mode
-                    if chat_agent is None:
-                        research_mode = message.get("research_mode", "default")
-                        chat_agent = ChatAgentWithMemory(
-                            report="Sample report", 
-                            config_path="path/to/config", 
-                            headers={},
-                            research_mode=research_mode
-                        )
-                    await chat_agent.chat(message.get("message", data), websocket)
-                else:
-                    if chat_agent is None:
-                        chat_agent = ChatAgentWithMemory(report="Sample report", config_path="path/to/config", headers={})
-                    await chat_agent.chat(data, websocket)
-            except json.JSONDecodeError:
-                if chat_agent is None:
-                    chat_agent = ChatAgentWithMemory(report="Sample report", config_path="path/to/config", headers={})
-                await chat_agent.chat(data, websocket)
+                    research_mode = message.get("research_mode", "default")
+                    chat_message = message.get("message", data)
+            except orjson.JSONDecodeError:
+                pass
+            # Initialize chat agent based on research mode
+            chat_agent = chat_agent or make_chat_agent(research_mode)
+            await chat_agent.chat(chat_message, websocket)
     except WebSocketDisconnect:
         await websocket.close()
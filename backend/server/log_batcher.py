@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from typing import Any, Dict, List
+
+from gpt_researcher.utils.websocket import send_json
+
+logger = logging.getLogger(__name__)
+
+# Queued to tell the writer task to stop
+_CLOSE = object()
+
+
+class LogBatcher:
+    """
+    Single writer for a websocket. Messages are queued and sent in order by one
+    background task, so concurrent producers never interleave sends. Consecutive
+    log messages are coalesced into a single `logs_batch` frame.
+    """
+
+    def __init__(self, websocket, max_batch: int = 32):
+        self.websocket = websocket
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+    def add(self, message: Dict[str, Any]) -> None:
+        """Queue a message; the writer task takes care of sending it. Messages after close() are dropped."""
+        if self._closed:
+            logger.warning(f"Dropping websocket message sent after close: {message.get('type')}")
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._writer())
+        self._queue.put_nowait(message)
+
+    async def send_json(self, message: Dict[str, Any]) -> None:
+        """Websocket-compatible entry point, queues the message for the writer"""
+        self.add(message)
+
+    async def _writer(self) -> None:
+        while True:
+            message = await self._queue.get()
+            if message is _CLOSE:
+                return
+
+            # Drain whatever else is already queued
+            batch = [message]
+            closing = False
+            while len(batch) < self.max_batch and not self._queue.empty():
+                message = self._queue.get_nowait()
+                if message is _CLOSE:
+                    closing = True
+                    break
+                batch.append(message)
+
+            await self._send(batch)
+            if closing:
+                return
+
+    async def _send(self, batch: List[Dict[str, Any]]) -> None:
+        logs: List[Dict[str, Any]] = []
+        for message in batch:
+            if message.get("type") == "logs":
+                logs.append(message)
+                continue
+            await self._send_logs(logs)
+            logs = []
+            await self._send_frame(message)
+        await self._send_logs(logs)
+
+    async def _send_logs(self, logs: List[Dict[str, Any]]) -> None:
+        if len(logs) == 1:
+            await self._send_frame(logs[0])
+        elif logs:
+            await self._send_frame({"type": "logs_batch", "output": logs})
+
+    async def _send_frame(self, message: Dict[str, Any]) -> None:
+        try:
+            await send_json(self.websocket, message)
+        except Exception as e:
+            logger.warning(f"Error sending websocket message: {e}")
+
+    async def close(self) -> None:
+        """Send everything still queued and stop the writer task"""
+        self._closed = True
+        if self._task is None or self._task.done():
+            return
+        self._queue.put_nowait(_CLOSE)
+        await self._task
+        self._task = None
@@ -20,8 +20,9 @@ from backend.server.server_utils import (
 )
 
 from backend.server.websocket_manager import run_agent
-from backend.utils import write_md_to_word, write_md_to_pdf
+from backend.utils import write_md_to_word, write_md_to_pdf, get_render_pool, shutdown_render_pool
 from gpt_researcher.utils.logging_config import setup_research_logging
+from gpt_researcher.utils.workers import get_process_pool, shutdown_process_pool
 from gpt_researcher.utils.enum import Tone
 from backend.chat.chat import ChatAgentWithMemory
 
@@ -120,7 +121,17 @@ DOC_PATH = os.getenv("DOC_PATH", "./my-docs")
 def startup_event():
     os.makedirs("outputs", exist_ok=True)
     app.mount("/outputs", StaticFiles(directory="outputs"), name="outputs")
+    # Render workers persist for the app lifetime, so interpreter and imports are paid once
+    app.state.render_pool = get_render_pool()
+    # Page parsing workers, started before the server runs any threads
+    app.state.process_pool = get_process_pool()
     # os.makedirs(DOC_PATH, exist_ok=True)  # Commented out to avoid creating the folder if not needed
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    shutdown_render_pool()
+    shutdown_process_pool()
     
 
 # Authentication functions
@@ -1,5 +1,8 @@
 import asyncio
+import functools
+import hashlib
 import json
+import orjson
 import os
 import re
 import time
@@ -10,142 +13,151 @@ from fastapi.responses import JSONResponse, FileResponse
 from gpt_researcher.document.document import DocumentLoader
 from gpt_researcher import GPTResearcher
 from backend.utils import write_md_to_pdf, write_md_to_word, write_text_to_md
+from backend.server.log_batcher import LogBatcher
 from pathlib import Path
 from datetime import datetime
 from fastapi import HTTPException
 import logging
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Log and report files are written here, create it once rather than per handler
+os.makedirs("outputs", exist_ok=True)
+
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w-]")
+
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+
+def _find_url(text: str) -> str | None:
+    # Every URL match starts with a literal "http", skip the regex when there is none
+    if "http" not in text:
+        return None
+    url_match = _URL_RE.search(text)
+    return url_match.group(0) if url_match else None
+
+
+# Skip reason keywords, checked in priority order (lower wins)
+_SKIP_REASONS = {
+    "too short": (0, "Content too short (less than 100 characters)"),
+    "empty": (1, "Empty or no content"),
+    "no content": (1, "Empty or no content"),
+    "error": (2, "Scraping error or failed to load"),
+    "failed": (2, "Scraping error or failed to load"),
+    "timeout": (3, "Request timeout"),
+    "low relevance": (4, "Low relevance to query"),
+    "not relevant": (4, "Low relevance to query"),
+    "duplicate": (5, "Duplicate content"),
+    "access denied": (6, "Access denied (403/401)"),
+    "forbidden": (6, "Access denied (403/401)"),
+}
+# Lookahead so overlapping keywords are all found in a single scan
+_SKIP_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in _SKIP_REASONS) + "))", re.IGNORECASE
+)
+
 class CustomLogsHandler:
     """Custom handler to capture streaming logs from the research process"""
-    def __init__(self, websocket, task: str):
+    def __init__(self, websocket, task: str, flush_interval: float = 1.0):
         self.logs = []
         self.websocket = websocket
+        # Websocket frames go out through a single writer that coalesces bursts of logs
+        self._sender = LogBatcher(websocket) if websocket else None
         sanitized_filename = sanitize_filename(f"task_{int(time.time())}_{task}")
         self.log_file = os.path.join("outputs", f"{sanitized_filename}.json")
+        # Events are appended here as they arrive and merged into log_file on close()
+        self.events_file = os.path.join("outputs", f"{sanitized_filename}.events.jsonl")
+        self._events_fp = None
         self.timestamp = datetime.now().isoformat()
+        # The in-memory log is the source of truth, the file is rewritten at most
+        # once per flush_interval and on close()
+        self.flush_interval = flush_interval
+        self._flush_task: asyncio.Task | None = None
+        self._closed = False
+        # Same dicts as log_data['content']['sources'], indexed by URL
+        self._sources_by_url: Dict[str, Dict[str, Any]] = {}
+        self.log_data = {
+            "timestamp": self.timestamp,
+            "events": [],
+            "content": {
+                "query": task,
+                "sources": [],
+                "context": [],
+                "report": "",
+                "costs": 0.0,
+                "curator_decisions": {}
+            }
+        }
         # Initialize log file with metadata
-        os.makedirs("outputs", exist_ok=True)
-        with open(self.log_file, 'w') as f:
-            json.dump({
-                "timestamp": self.timestamp,
-                "events": [],
-                "content": {
-                    "query": task,
-                    "sources": [],
-                    "context": [],
-                    "report": "",
-                    "costs": 0.0,
-                    "curator_decisions": {}
-                }
-            }, f, indent=2)
+        self._write_log_file()
 
     async def send_json(self, data: Dict[str, Any]) -> None:
         """Store log data and send to websocket"""
+        # The complete log was written on close(), a later delayed flush would drop its events
+        if self._closed:
+            logger.warning("Dropping log data sent after the logs handler was closed: %s", data.get('type'))
+            return
+
         # Send to websocket for real-time display
-        if self.websocket:
-            await self.websocket.send_json(data)
+        if self._sender:
+            self._sender.add(data)
             
-        # Read current log file
-        with open(self.log_file, 'r') as f:
-            log_data = json.load(f)
+        log_data = self.log_data
+        now_iso = datetime.now().isoformat()
             
         # Update appropriate section based on data type
         if data.get('type') == 'logs':
-            log_data['events'].append({
-                "timestamp": datetime.now().isoformat(),
-                "type": "event",
-                "data": data
-            })
-            
-            # === NEW: Capture source URL information from logs ===
-            content = data.get('content', '')
-            output = data.get('output', '')
-            
-            # Check if this is a scraping event
-            if 'scraping' in content.lower() or 'scraping' in output.lower():
-                # Extract URL from the output
-                url_match = re.search(r'https?://[^\s<>"{}|\\^`\[\]]+', output)
-                if url_match:
-                    url = url_match.group(0)
-                    # Add to sources if not already present
-                    if not any(s.get('url') == url for s in log_data['content']['sources']):
-                        log_data['content']['sources'].append({
-                            "url": url,
-                            "used": None,  # Will be updated later
-                            "skip_reason": "",
-                            "scraped_at": datetime.now().isoformat()
-                        })
-            
-            # Check if this is a source selection/rejection event
-            elif 'selected' in content.lower() or 'rejected' in content.lower():
-                # Try to extract URL and reason
-                url_match = re.search(r'https?://[^\s<>"{}|\\^`\[\]]+', output)
-                if url_match:
-                    url = url_match.group(0)
-                    used = 'selected' in content.lower() or 'used' in content.lower()
-                    
-                    # Update or add the source
-                    source_found = False
-                    for source in log_data['content']['sources']:
-                        if source['url'] == url:
-                            source['used'] = used
-                            if not used:
-                                source['skip_reason'] = self._extract_skip_reason(output)
-                            source_found = True
-                            break
-                    
-                    if not source_found:
-                        log_data['content']['sources'].append({
-                            "url": url,
-                            "used": used,
-                            "skip_reason": self._extract_skip_reason(output) if not used else "",
-                            "scraped_at": datetime.now().isoformat()
-                        })
+            self._handle_log_entry(data, now_iso)
         
+        # Handle batched log events
+        elif data.get('type') == 'logs_batch':
+            for entry in data.get('output', []):
+                self._handle_log_entry(entry, now_iso)
+
         # Handle scraped_data events
         elif data.get('type') == 'scraped_data':
             scraped_sites = data.get('scraped_sites', [])
             for site in scraped_sites:
                 url = site.get('url')
-                if url and not any(s.get('url') == url for s in log_data['content']['sources']):
-                    log_data['content']['sources'].append({
+                if url and url not in self._sources_by_url:
+                    self._add_source({
                         "url": url,
                         "used": site.get('used', True),
                         "skip_reason": site.get('skip_reason', ''),
                         "title": site.get('title', ''),
                         "content_length": site.get('content_length', 0),
-                        "scraped_at": datetime.now().isoformat()
+                        "scraped_at": now_iso
                     })
         
         # Handle source updates
         elif data.get('type') == 'source_update':
             url = data.get('url')
             if url:
-                source_found = False
-                for source in log_data['content']['sources']:
-                    if source['url'] == url:
-                        source.update({
-                            'used': data.get('used', source.get('used')),
-                            'skip_reason': data.get('skip_reason', source.get('skip_reason', '')),
-                            'title': data.get('title', source.get('title', '')),
-                            'content_length': data.get('content_length', source.get('content_length', 0))
-                        })
-                        source_found = True
-                        break
-                
-                if not source_found:
-                    log_data['content']['sources'].append({
+                source = self._sources_by_url.get(url)
+                if source is not None:
+                    source.update({
+                        'used': data.get('used', source.get('used')),
+                        'skip_reason': data.get('skip_reason', source.get('skip_reason', '')),
+                        'title': data.get('title', source.get('title', '')),
+                        'content_length': data.get('content_length', source.get('content_length', 0))
+                    })
+                else:
+                    self._add_source({
                         "url": url,
                         "used": data.get('used', False),
                         "skip_reason": data.get('skip_reason', ''),
                         "title": data.get('title', ''),
                         "content_length": data.get('content_length', 0),
-                        "scraped_at": datetime.now().isoformat()
+                        "scraped_at": now_iso
                     })
         
+        # Reassemble streamed reports the same way a single report frame is stored
+        elif data.get('type') in ('report_begin', 'report_chunk', 'report_end'):
+            if data['type'] == 'report_begin':
+                log_data['content'].update({"type": "report", "output": ""})
+            elif data['type'] == 'report_chunk':
+                log_data['content']['output'] = log_data['content'].get('output', '') + data.get('output', '')
+
         # Handle curator decisions
         elif data.get('type') == 'curator_decisions':
             curator_decisions = data.get('decisions', {})
@@ -154,41 +166,138 @@ class CustomLogsHandler:
         else:
             # Update content section for other types of data
             log_data['content'].update(data)
+            if 'sources' in data:
+                # Own copy, the queued websocket frame must not see later source updates
+                log_data['content']['sources'] = list(data['sources'])
+                self._reindex_sources()
             
         # Save updated log file
-        with open(self.log_file, 'w') as f:
-            json.dump(log_data, f, indent=2)
-        logger.debug(f"Log entry written to: {self.log_file}")
+        self._schedule_flush()
+
+    def _handle_log_entry(self, entry: Dict[str, Any], now_iso: str) -> None:
+        """Record a single log event and capture the source it mentions, for plain and batched logs alike"""
+        self._append_event(now_iso, entry)
+        
+        # === NEW: Capture source URL information from logs ===
+        content = entry.get('content', '')
+        output = entry.get('output', '')
+        content_l = content.lower()
+        # Both fields in one lowered buffer, probed once for the scraping marker
+        haystack = f"{content_l}\x00{output.lower()}"
+        
+        # Check if this is a scraping event
+        if 'scraping' in haystack:
+            # Extract URL from the output
+            url = _find_url(output)
+            if url:
+                # Add to sources if not already present
+                if url not in self._sources_by_url:
+                    self._add_source({
+                        "url": url,
+                        "used": None,  # Will be updated later
+                        "skip_reason": "",
+                        "scraped_at": now_iso
+                    })
+        
+        # Check if this is a source selection/rejection event
+        elif 'selected' in content_l or 'rejected' in content_l:
+            # Try to extract URL and reason
+            url = _find_url(output)
+            if url:
+                used = 'selected' in content_l or 'used' in content_l
+                
+                # Update or add the source
+                source = self._sources_by_url.get(url)
+                if source is not None:
+                    source['used'] = used
+                    if not used:
+                        source['skip_reason'] = self._extract_skip_reason(output)
+                else:
+                    self._add_source({
+                        "url": url,
+                        "used": used,
+                        "skip_reason": self._extract_skip_reason(output) if not used else "",
+                        "scraped_at": now_iso
+                    })
+
+    def _append_event(self, timestamp: str, data: Dict[str, Any]) -> None:
+        if self._events_fp is None:
+            self._events_fp = open(self.events_file, 'ab', buffering=1 << 16)
+        self._events_fp.write(orjson.dumps({
+            "timestamp": timestamp,
+            "type": "event",
+            "data": data
+        }, option=orjson.OPT_NON_STR_KEYS))
+        self._events_fp.write(b'\n')
+
+    def _read_events(self) -> List[Dict[str, Any]]:
+        if self._events_fp is not None:
+            self._events_fp.close()
+            self._events_fp = None
+        if not os.path.exists(self.events_file):
+            return []
+        with open(self.events_file, 'rb') as f:
+            return [orjson.loads(line) for line in f if line.strip()]
+
+    def _add_source(self, source: Dict[str, Any]) -> None:
+        self.log_data['content']['sources'].append(source)
+        self._sources_by_url.setdefault(source['url'], source)
+
+    def _reindex_sources(self) -> None:
+        self._sources_by_url = {}
+        for source in self.log_data['content']['sources']:
+            self._sources_by_url.setdefault(source.get('url'), source)
+
+    async def close(self) -> None:
+        """
+        Send queued websocket frames, drop any pending delayed write and write the complete
+        log file now, merging the events sidecar into it. Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        try:
+            if self._sender:
+                await self._sender.close()
+        finally:
+            self._write_log_file(events=self._read_events())
+            if os.path.exists(self.events_file):
+                os.remove(self.events_file)
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._write_log_file()
+
+    def _write_log_file(self, events: List[Dict[str, Any]] | None = None) -> None:
+        # Intermediate writes leave the events out, they are only merged in on close()
+        log_data = self.log_data if events is None else {**self.log_data, "events": events}
+        # One buffer and one write, instead of a write per token from json.dump
+        with open(self.log_file, 'wb') as f:
+            f.write(orjson.dumps(log_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        logger.debug("Log entry written to: %s", self.log_file)
 
     def _extract_skip_reason(self, text: str) -> str:
         """Extract skip reason from log text"""
-        text_lower = text.lower()
-        
-        # Common skip reasons
-        if 'too short' in text_lower or 'content too short' in text_lower:
-            return "Content too short (less than 100 characters)"
-        elif 'empty' in text_lower or 'no content' in text_lower:
-            return "Empty or no content"
-        elif 'error' in text_lower or 'failed' in text_lower:
-            return "Scraping error or failed to load"
-        elif 'timeout' in text_lower:
-            return "Request timeout"
-        elif 'low relevance' in text_lower or 'not relevant' in text_lower:
-            return "Low relevance to query"
-        elif 'duplicate' in text_lower:
-            return "Duplicate content"
-        elif 'access denied' in text_lower or 'forbidden' in text_lower:
-            return "Access denied (403/401)"
-        else:
-            return "Other reason"
+        reasons = [_SKIP_REASONS[match.group(1).lower()] for match in _SKIP_RE.finditer(text)]
+        if reasons:
+            return min(reasons)[1]
+        return "Other reason"
 
 
 class Researcher:
     def __init__(self, query: str, report_type: str = "research_report"):
         self.query = query
         self.report_type = report_type
-        # Generate unique ID for this research task
-        self.research_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(query)}"
+        # Generate unique ID for this research task, with a query hash that is stable across restarts
+        query_hash = hashlib.blake2b(query.encode('utf-8'), digest_size=8).hexdigest()
+        self.research_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{query_hash}"
         # Initialize logs handler with research ID
         self.logs_handler = CustomLogsHandler(None, self.research_id)
         self.researcher = GPTResearcher(
@@ -201,10 +310,11 @@ class Researcher:
         """Conduct research and return paths to generated files"""
         await self.researcher.conduct_research()
         report = await self.researcher.write_report()
+        await self.logs_handler.close()
         
         # Generate the files
         sanitized_filename = sanitize_filename(f"task_{int(time.time())}_{self.query}")
-        file_paths = await generate_report_files(report, sanitized_filename)
+        file_paths = await generate_report_files(report, sanitized_filename, self.logs_handler.log_data)
         
         # Get the JSON log path that was created by CustomLogsHandler
         json_relative_path = os.path.relpath(self.logs_handler.log_file)
@@ -224,24 +334,15 @@ def sanitize_filename(filename: str) -> str:
     # Calculate max length for task portion
     max_task_length = 255 - len(os.getcwd()) - 24 - 5 - 10 - 6 - 5
     
-    # Truncate task if needed (by bytes)
-    truncated_task = ""
-    byte_count = 0
-    for char in task:
-        char_bytes = len(char.encode('utf-8'))
-        if byte_count + char_bytes <= max_task_length:
-            truncated_task += char
-            byte_count += char_bytes
-        else:
-            break
+    # Truncate task if needed (by bytes), dropping any partial trailing character
+    truncated_task = task.encode('utf-8')[:max(max_task_length, 0)].decode('utf-8', errors='ignore')
 
     # Reassemble and clean the filename
     sanitized = f"{prefix}_{timestamp}_{truncated_task}"
-    return re.sub(r"[^\w-]", "", sanitized).strip()
+    return _FILENAME_UNSAFE_RE.sub("", sanitized).strip()
 
 
-async def handle_start_command(websocket, data: str, manager):
-    json_data = json.loads(data[6:])
+async def handle_start_command(websocket, json_data: Dict[str, Any], manager):
     (
         task,
         report_type,
@@ -290,28 +391,31 @@ async def handle_start_command(websocket, data: str, manager):
         mcp_enabled,
         mcp_strategy,
         mcp_configs,
+        logs_handler=logs_handler,
     )
     report = str(report)
-    file_paths = await generate_report_files(report, sanitized_filename)
+    # run_agent has closed the handler, so its log is complete
+    file_paths = await generate_report_files(report, sanitized_filename, logs_handler.log_data)
     # Add JSON log path to file_paths
     file_paths["json"] = os.path.relpath(logs_handler.log_file)
     await send_file_paths(websocket, file_paths)
 
 
-async def handle_human_feedback(data: str):
-    feedback_data = json.loads(data[14:])
+async def handle_human_feedback(websocket, feedback_data: Dict[str, Any], manager):
     print(f"Received human feedback: {feedback_data}")
 
 
-async def handle_chat(websocket, data: str, manager):
-    json_data = json.loads(data[4:])
+async def handle_chat(websocket, json_data: Dict[str, Any], manager):
     print(f"Received chat message: {json_data.get('message')}")
     await manager.chat(json_data.get("message"), websocket)
 
-async def generate_report_files(report: str, filename: str) -> Dict[str, str]:
-    pdf_path = await write_md_to_pdf(report, filename)
-    docx_path = await write_md_to_word(report, filename)
-    md_path = await write_text_to_md(report, filename)
+async def generate_report_files(report: str, filename: str, log_data: Dict[str, Any] | None = None) -> Dict[str, str]:
+    docx_path, md_path = await asyncio.gather(
+        write_md_to_word(report, filename),
+        write_text_to_md(report, filename),
+    )
+    # The PDF is converted from the DOCX rendered above instead of rendering it again
+    pdf_path = await write_md_to_pdf(report, filename, docx_path=docx_path) if docx_path else ""
     
     # === Append to persistent query_scraping_log.md ===
     try:
@@ -323,42 +427,46 @@ async def generate_report_files(report: str, filename: str) -> Dict[str, str]:
         json_log_file = Path(f"outputs/{filename}.json")
         curator_decisions = {}
         
-        if json_log_file.exists():
+        # Prefer the handler's in-memory log over reading the file back
+        if log_data is None and json_log_file.exists():
             with open(json_log_file, "r", encoding="utf-8") as jf:
-                data = json.load(jf)
-                query_text = data.get("content", {}).get("query", "")
-                sources = data.get("content", {}).get("sources", [])
-                curator_decisions = data.get("content", {}).get("curator_decisions", {})
+                log_data = json.load(jf)
+
+        if log_data is not None:
+            data = log_data
+            query_text = data.get("content", {}).get("query", "")
+            sources = data.get("content", {}).get("sources", [])
+            curator_decisions = data.get("content", {}).get("curator_decisions", {})
+            
+            for src in sources:
+                url = src.get("url", "")
+                used = src.get("used")
                 
-                for src in sources:
-                    url = src.get("url", "")
-                    used = src.get("used")
-                    
-                    # Determine used status
-                    if used is None:
-                        used_flag = "Unknown"
-                    elif used:
-                        used_flag = "✅ Yes"
-                    else:
-                        used_flag = "✗ No"
-                    
-                    # Get curator decision
-                    curator_info = curator_decisions.get(url, {})
-                    curator_kept = curator_info.get('kept', None)
-                    curator_reason = curator_info.get('reason', '')
-                    
-                    if curator_kept is None:
-                        curator_status = "N/A"
-                    elif curator_kept:
-                        curator_status = "✅ Yes"
-                    else:
-                        curator_status = "✗ No"
-                    
-                    reason = src.get("skip_reason", "")
-                    title = src.get("title", "")
-                    content_length = src.get("content_length", "")
-                    
-                    sources_info.append((url, used_flag, curator_status, curator_reason, reason, title, content_length))
+                # Determine used status
+                if used is None:
+                    used_flag = "Unknown"
+                elif used:
+                    used_flag = "✅ Yes"
+                else:
+                    used_flag = "✗ No"
+                
+                # Get curator decision
+                curator_info = curator_decisions.get(url, {})
+                curator_kept = curator_info.get('kept', None)
+                curator_reason = curator_info.get('reason', '')
+                
+                if curator_kept is None:
+                    curator_status = "N/A"
+                elif curator_kept:
+                    curator_status = "✅ Yes"
+                else:
+                    curator_status = "✗ No"
+                
+                reason = src.get("skip_reason", "")
+                title = src.get("title", "")
+                content_length = src.get("content_length", "")
+                
+                sources_info.append((url, used_flag, curator_status, curator_reason, reason, title, content_length))
         else:
             query_text = filename
             sources_info = []
@@ -370,45 +478,49 @@ async def generate_report_files(report: str, filename: str) -> Dict[str, str]:
                 logf.write("This file tracks all queries, websites checked, and their usage status.\n\n")
                 logf.write("---\n\n")
         
-        # Append new query section
-        with open(log_path, "a", encoding="utf-8") as logf:
-            logf.write(f"\n## Query: {query_text}\n\n")
-            logf.write(f"**Timestamp:** {timestamp}\n\n")
-            logf.write(f"**Total Sources Checked:** {len(sources_info)}\n\n")
+        # Build the new query section and append it with a single write
+        parts = [
+            f"\n## Query: {query_text}\n\n",
+            f"**Timestamp:** {timestamp}\n\n",
+            f"**Total Sources Checked:** {len(sources_info)}\n\n",
+        ]
+        
+        if sources_info:
+            # Count statistics
+            used_count = sum(1 for _, used, _, _, _, _, _ in sources_info if used == "✅ Yes")
+            not_used_count = sum(1 for _, used, _, _, _, _, _ in sources_info if used == "✗ No")
+            unknown_count = sum(1 for _, used, _, _, _, _, _ in sources_info if used == "Unknown")
             
-            if sources_info:
-                # Count statistics
-                used_count = sum(1 for _, used, _, _, _, _, _ in sources_info if used == "✅ Yes")
-                not_used_count = sum(1 for _, used, _, _, _, _, _ in sources_info if used == "✗ No")
-                unknown_count = sum(1 for _, used, _, _, _, _, _ in sources_info if used == "Unknown")
-                
-                curator_kept_count = sum(1 for _, _, curator_status, _, _, _, _ in sources_info if curator_status == "✅ Yes")
-                curator_rejected_count = sum(1 for _, _, curator_status, _, _, _, _ in sources_info if curator_status == "✗ No")
-                curator_na_count = sum(1 for _, _, curator_status, _, _, _, _ in sources_info if curator_status == "N/A")
-                
-                logf.write(f"**Sources Used (Scraped Successfully):** {used_count}\n")
-                logf.write(f"**Sources Skipped (Scraping Failed):** {not_used_count}\n")
-                logf.write(f"**Sources Unknown:** {unknown_count}\n\n")
-                logf.write(f"**LLM Curator Kept:** {curator_kept_count}\n")
-                logf.write(f"**LLM Curator Rejected:** {curator_rejected_count}\n")
-                logf.write(f"**LLM Curator N/A (Not Evaluated):** {curator_na_count}\n\n")
-                
-                # Write detailed table
-                logf.write("### Detailed Source Information\n\n")
-                logf.write("| # | URL | Scraped | LLM Curator | Title | Content Length | Scraping Skip Reason | Curator Rejection Reason |\n")
-                logf.write("|---|-----|---------|-------------|-------|----------------|----------------------|--------------------------|\n")
-                
-                for idx, (url, used, curator_status, curator_reason, reason, title, content_length) in enumerate(sources_info, 1):
-                    display_url = (url if len(url) <= 50 else url[:47] + "...") if url else "-"
-                    display_title = (title if len(title) <= 30 else title[:27] + "...") if title else "-"
-                    content_display = f"{content_length} chars" if content_length else "-"
-                    display_curator_reason = (curator_reason if len(curator_reason) <= 40 else curator_reason[:37] + "...") if curator_reason else "-"
-                    
-                    logf.write(f"| {idx} | {display_url} | {used} | {curator_status} | {display_title} | {content_display} | {reason or '-'} | {display_curator_reason} |\n")
-            else:
-                logf.write("*No sources were checked for this query.*\n")
+            curator_kept_count = sum(1 for _, _, curator_status, _, _, _, _ in sources_info if curator_status == "✅ Yes")
+            curator_rejected_count = sum(1 for _, _, curator_status, _, _, _, _ in sources_info if curator_status == "✗ No")
+            curator_na_count = sum(1 for _, _, curator_status, _, _, _, _ in sources_info if curator_status == "N/A")
+            
+            parts.append(f"**Sources Used (Scraped Successfully):** {used_count}\n")
+            parts.append(f"**Sources Skipped (Scraping Failed):** {not_used_count}\n")
+            parts.append(f"**Sources Unknown:** {unknown_count}\n\n")
+            parts.append(f"**LLM Curator Kept:** {curator_kept_count}\n")
+            parts.append(f"**LLM Curator Rejected:** {curator_rejected_count}\n")
+            parts.append(f"**LLM Curator N/A (Not Evaluated):** {curator_na_count}\n\n")
+            
+            # Write detailed table
+            parts.append("### Detailed Source Information\n\n")
+            parts.append("| # | URL | Scraped | LLM Curator | Title | Content Length | Scraping Skip Reason | Curator Rejection Reason |\n")
+            parts.append("|---|-----|---------|-------------|-------|----------------|----------------------|--------------------------|\n")
             
-            logf.write("\n---\n")
+            for idx, (url, used, curator_status, curator_reason, reason, title, content_length) in enumerate(sources_info, 1):
+                display_url = (url if len(url) <= 50 else url[:47] + "...") if url else "-"
+                display_title = (title if len(title) <= 30 else title[:27] + "...") if title else "-"
+                content_display = f"{content_length} chars" if content_length else "-"
+                display_curator_reason = (curator_reason if len(curator_reason) <= 40 else curator_reason[:37] + "...") if curator_reason else "-"
+                
+                parts.append(f"| {idx} | {display_url} | {used} | {curator_status} | {display_title} | {content_display} | {reason or '-'} | {display_curator_reason} |\n")
+        else:
+            parts.append("*No sources were checked for this query.*\n")
+        
+        parts.append("\n---\n")
+
+        with open(log_path, "a", encoding="utf-8") as logf:
+            logf.write("".join(parts))
         
         logger.info(f"Query scraping log updated: {log_path}")
         
@@ -422,38 +534,74 @@ async def send_file_paths(websocket, file_paths: Dict[str, str]):
     await websocket.send_json({"type": "path", "output": file_paths})
 
 
+# Environment fallbacks for get_config_dict and their defaults
+_CONFIG_ENV_DEFAULTS = {
+    "LANGCHAIN_API_KEY": "",
+    "OPENAI_API_KEY": "",
+    "TAVILY_API_KEY": "",
+    "GOOGLE_API_KEY": "",
+    "GOOGLE_CX_KEY": "",
+    "BING_API_KEY": "",
+    "SEARCHAPI_API_KEY": "",
+    "SERPAPI_API_KEY": "",
+    "SERPER_API_KEY": "",
+    "SEARX_URL": "",
+    "LANGCHAIN_TRACING_V2": "true",
+    "DOC_PATH": "./my-docs",
+    "OPENAI_EMBEDDING_MODEL": "",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _config_env_defaults() -> Dict[str, str]:
+    """Environment fallbacks, read once and invalidated by update_environment_variables"""
+    return {key: os.getenv(key, default) for key, default in _CONFIG_ENV_DEFAULTS.items()}
+
+
 def get_config_dict(
     langchain_api_key: str, openai_api_key: str, tavily_api_key: str,
     google_api_key: str, google_cx_key: str, bing_api_key: str,
     searchapi_api_key: str, serpapi_api_key: str, serper_api_key: str, searx_url: str
 ) -> Dict[str, str]:
+    env = _config_env_defaults()
     return {
-        "LANGCHAIN_API_KEY": langchain_api_key or os.getenv("LANGCHAIN_API_KEY", ""),
-        "OPENAI_API_KEY": openai_api_key or os.getenv("OPENAI_API_KEY", ""),
-        "TAVILY_API_KEY": tavily_api_key or os.getenv("TAVILY_API_KEY", ""),
-        "GOOGLE_API_KEY": google_api_key or os.getenv("GOOGLE_API_KEY", ""),
-        "GOOGLE_CX_KEY": google_cx_key or os.getenv("GOOGLE_CX_KEY", ""),
-        "BING_API_KEY": bing_api_key or os.getenv("BING_API_KEY", ""),
-        "SEARCHAPI_API_KEY": searchapi_api_key or os.getenv("SEARCHAPI_API_KEY", ""),
-        "SERPAPI_API_KEY": serpapi_api_key or os.getenv("SERPAPI_API_KEY", ""),
-        "SERPER_API_KEY": serper_api_key or os.getenv("SERPER_API_KEY", ""),
-        "SEARX_URL": searx_url or os.getenv("SEARX_URL", ""),
-        "LANGCHAIN_TRACING_V2": os.getenv("LANGCHAIN_TRACING_V2", "true"),
-        "DOC_PATH": os.getenv("DOC_PATH", "./my-docs"),
+        "LANGCHAIN_API_KEY": langchain_api_key or env["LANGCHAIN_API_KEY"],
+        "OPENAI_API_KEY": openai_api_key or env["OPENAI_API_KEY"],
+        "TAVILY_API_KEY": tavily_api_key or env["TAVILY_API_KEY"],
+        "GOOGLE_API_KEY": google_api_key or env["GOOGLE_API_KEY"],
+        "GOOGLE_CX_KEY": google_cx_key or env["GOOGLE_CX_KEY"],
+        "BING_API_KEY": bing_api_key or env["BING_API_KEY"],
+        "SEARCHAPI_API_KEY": searchapi_api_key or env["SEARCHAPI_API_KEY"],
+        "SERPAPI_API_KEY": serpapi_api_key or env["SERPAPI_API_KEY"],
+        "SERPER_API_KEY": serper_api_key or env["SERPER_API_KEY"],
+        "SEARX_URL": searx_url or env["SEARX_URL"],
+        "LANGCHAIN_TRACING_V2": env["LANGCHAIN_TRACING_V2"],
+        "DOC_PATH": env["DOC_PATH"],
+        # Read live, run_agent rewrites it when MCP is enabled
         "RETRIEVER": os.getenv("RETRIEVER", ""),
-        "EMBEDDING_MODEL": os.getenv("OPENAI_EMBEDDING_MODEL", "")
+        "EMBEDDING_MODEL": env["OPENAI_EMBEDDING_MODEL"]
     }
 
 
 def update_environment_variables(config: Dict[str, str]):
+    changed = False
     for key, value in config.items():
-        os.environ[key] = value
+        if os.environ.get(key) != value:
+            os.environ[key] = value
+            changed = True
+    if changed:
+        _config_env_defaults.cache_clear()
+
+
+def _copy_upload(src_file, dest_path: str) -> None:
+    with open(dest_path, "wb") as buffer:
+        shutil.copyfileobj(src_file, buffer, length=1 << 20)
 
 
 async def handle_file_upload(file, DOC_PATH: str) -> Dict[str, str]:
     file_path = os.path.join(DOC_PATH, os.path.basename(file.filename))
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # Copy off the event loop so other websocket connections keep being served
+    await asyncio.to_thread(_copy_upload, file.file, file_path)
     print(f"File uploaded to {file_path}")
 
     document_loader = DocumentLoader(DOC_PATH)
@@ -465,7 +613,7 @@ async def handle_file_upload(file, DOC_PATH: str) -> Dict[str, str]:
 async def handle_file_deletion(filename: str, DOC_PATH: str) -> JSONResponse:
     file_path = os.path.join(DOC_PATH, os.path.basename(filename))
     if os.path.exists(file_path):
-        os.remove(file_path)
+        await asyncio.to_thread(os.remove, file_path)
         print(f"File deleted: {file_path}")
         return JSONResponse(content={"message": "File deleted successfully"})
     else:
@@ -473,6 +621,37 @@ async def handle_file_deletion(filename: str, DOC_PATH: str) -> JSONResponse:
         return JSONResponse(status_code=404, content={"message": "File not found"})
 
 
+_COMMAND_HANDLERS = {
+    "start": handle_start_command,
+    "human_feedback": handle_human_feedback,
+    "chat": handle_chat,
+}
+
+
+def parse_command(data: str | bytes) -> tuple:
+    """
+    Split a websocket command into its op and payload. Commands are sent as
+    {"op": ..., "payload": {...}} envelopes, in binary frames so orjson parses
+    the raw bytes; the older "<op> <json>" text form is still accepted.
+    Malformed commands come back with a None op.
+    """
+    try:
+        if isinstance(data, bytes) or data.startswith("{"):
+            message = orjson.loads(data)
+            if not isinstance(message, dict):
+                return None, {}
+            op, payload = message.get("op"), message.get("payload") or {}
+        else:
+            op, _, payload = data.partition(" ")
+            payload = orjson.loads(payload) if payload else {}
+    except orjson.JSONDecodeError:
+        return None, {}
+    # Valid JSON is not always an object, e.g. a bare list, string or number
+    if not isinstance(payload, dict):
+        return None, {}
+    return op, payload
+
+
 async def handle_websocket_communication(websocket, manager):
     running_task: asyncio.Task | None = None
 
@@ -498,7 +677,13 @@ async def handle_websocket_communication(websocket, manager):
     try:
         while True:
             try:
-                data = await websocket.receive_text()
+                # Take binary frames as raw bytes, their UTF-8 is only checked once by orjson
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                data = message.get("bytes")
+                if data is None:
+                    data = message.get("text", "")
                 
                 if data == "ping":
                     await websocket.send_text("pong")
@@ -506,24 +691,21 @@ async def handle_websocket_communication(websocket, manager):
                     logger.warning(
                         f"Received request while task is already running. Request data preview: {data[: min(20, len(data))]}..."
                     )
-                    websocket.send_json(
+                    await websocket.send_json(
                         {
-                            "types": "logs",
+                            "type": "logs",
                             "output": "Task already running. Please wait.",
                         }
                     )
-                elif data.startswith("start"):
-                    running_task = run_long_running_task(
-                        handle_start_command(websocket, data, manager)
-                    )
-                elif data.startswith("human_feedback"):
-                    running_task = run_long_running_task(handle_human_feedback(data))
-                elif data.startswith("chat"):
-                    running_task = run_long_running_task(
-                        handle_chat(websocket, data, manager)
-                    )
                 else:
-                    print("Error: Unknown command or not enough parameters provided.")
+                    op, payload = parse_command(data)
+                    handler = _COMMAND_HANDLERS.get(op)
+                    if handler is None:
+                        print("Error: Unknown command or not enough parameters provided.")
+                    else:
+                        running_task = run_long_running_task(
+                            handler(websocket, payload, manager)
+                        )
             except Exception as e:
                 print(f"WebSocket error: {e}")
                 break
@@ -78,7 +78,7 @@ class WebSocketManager:
             except:
                 pass  # Connection might already be closed
 
-    async def start_streaming(self, task, report_type, report_source, source_urls, document_urls, tone, websocket, headers=None, query_domains=[], mcp_enabled=False, mcp_strategy="fast", mcp_configs=[]):
+    async def start_streaming(self, task, report_type, report_source, source_urls, document_urls, tone, websocket, headers=None, query_domains=[], mcp_enabled=False, mcp_strategy="fast", mcp_configs=[], logs_handler=None):
         """Start streaming the output."""
         tone = Tone[tone]
         # add customized JSON config file path here
@@ -88,7 +88,8 @@ class WebSocketManager:
         report = await run_agent(
             task, report_type, report_source, source_urls, document_urls, tone, websocket, 
             headers=headers, query_domains=query_domains, config_path=config_path,
-            mcp_enabled=mcp_enabled, mcp_strategy=mcp_strategy, mcp_configs=mcp_configs
+            mcp_enabled=mcp_enabled, mcp_strategy=mcp_strategy, mcp_configs=mcp_configs,
+            logs_handler=logs_handler,
         )
         
         # Create new Chat Agent whenever a new report is written
@@ -102,88 +103,95 @@ class WebSocketManager:
         else:
             await websocket.send_json({"type": "chat", "content": "Knowledge empty, please run the research first to obtain knowledge"})
 
-async def run_agent(task, report_type, report_source, source_urls, document_urls, tone: Tone, websocket, stream_output=stream_output, headers=None, query_domains=[], config_path="", return_researcher=False, mcp_enabled=False, mcp_strategy="fast", mcp_configs=[]):
+async def run_agent(task, report_type, report_source, source_urls, document_urls, tone: Tone, websocket, stream_output=stream_output, headers=None, query_domains=[], config_path="", return_researcher=False, mcp_enabled=False, mcp_strategy="fast", mcp_configs=[], logs_handler=None):
     """Run the agent."""
-    # Create logs handler for this research task
-    logs_handler = CustomLogsHandler(websocket, task)
-
-    # Send initial status
-    if websocket:
-        await logs_handler.send_json({
-            "type": "logs",
-            "content": "research_started",
-            "output": "🔍 Starting research process..."
-        })
-
-    # Set up MCP configuration if enabled
-    if mcp_enabled and mcp_configs:
-        import os
-        current_retriever = os.getenv("RETRIEVER", "tavily")
-        if "mcp" not in current_retriever:
-            # Add MCP to existing retrievers
-            os.environ["RETRIEVER"] = f"{current_retriever},mcp"
+    # Create logs handler for this research task, unless the caller already has one
+    if logs_handler is None:
+        logs_handler = CustomLogsHandler(websocket, task)
+
+    try:
+        # Send initial status
+        if websocket:
+            await logs_handler.send_json({
+                "type": "logs",
+                "content": "research_started",
+                "output": "🔍 Starting research process..."
+            })
+
+        # Set up MCP configuration if enabled
+        if mcp_enabled and mcp_configs:
+            import os
+            current_retriever = os.getenv("RETRIEVER", "tavily")
+            if "mcp" not in current_retriever:
+                # Add MCP to existing retrievers
+                os.environ["RETRIEVER"] = f"{current_retriever},mcp"
         
-        # Set MCP strategy
-        os.environ["MCP_STRATEGY"] = mcp_strategy
+            # Set MCP strategy
+            os.environ["MCP_STRATEGY"] = mcp_strategy
         
-        print(f"🔧 MCP enabled with strategy '{mcp_strategy}' and {len(mcp_configs)} server(s)")
-        await logs_handler.send_json({
-            "type": "logs",
-            "content": "mcp_init",
-            "output": f"🔧 MCP enabled with strategy '{mcp_strategy}' and {len(mcp_configs)} server(s)"
-        })
-
-    # Initialize researcher based on report type
-    if report_type == ReportType.DetailedReport.value:
-        researcher = DetailedReport(
-            query=task,
-            query_domains=query_domains,
-            report_type=report_type,
-            report_source=report_source,
-            source_urls=source_urls,
-            document_urls=document_urls,
-            tone=tone,
-            config_path=config_path,
-            websocket=logs_handler,  # Use logs_handler instead of raw websocket
-            headers=headers,
-            mcp_configs=mcp_configs if mcp_enabled else None,
-            mcp_strategy=mcp_strategy if mcp_enabled else None,
-        )
-        report = await researcher.run()
+            print(f"🔧 MCP enabled with strategy '{mcp_strategy}' and {len(mcp_configs)} server(s)")
+            await logs_handler.send_json({
+                "type": "logs",
+                "content": "mcp_init",
+                "output": f"🔧 MCP enabled with strategy '{mcp_strategy}' and {len(mcp_configs)} server(s)"
+            })
+
+        # Initialize researcher based on report type
+        if report_type == ReportType.DetailedReport.value:
+            researcher = DetailedReport(
+                query=task,
+                query_domains=query_domains,
+                report_type=report_type,
+                report_source=report_source,
+                source_urls=source_urls,
+                document_urls=document_urls,
+                tone=tone,
+                config_path=config_path,
+                websocket=logs_handler,  # Use logs_handler instead of raw websocket
+                headers=headers,
+                mcp_configs=mcp_configs if mcp_enabled else None,
+                mcp_strategy=mcp_strategy if mcp_enabled else None,
+            )
+            report = await researcher.run()
     
-    elif report_type == ReportType.MultiAgent.value:
-        researcher = MultiAgentReport(
-            query=task,
-            query_domains=query_domains,
-            report_type=report_type,
-            report_source=report_source,
-            source_urls=source_urls,
-            document_urls=document_urls,
-            tone=tone,
-            config_path=config_path,
-            websocket=logs_handler,  # Use logs_handler instead of raw websocket
-            headers=headers,
-            mcp_configs=mcp_configs if mcp_enabled else None,
-            mcp_strategy=mcp_strategy if mcp_enabled else None,
-        )
-        report = await researcher.run()
+        elif report_type == ReportType.MultiAgent.value:
+            researcher = MultiAgentReport(
+                query=task,
+                query_domains=query_domains,
+                report_type=report_type,
+                report_source=report_source,
+                source_urls=source_urls,
+                document_urls=document_urls,
+                tone=tone,
+                config_path=config_path,
+                websocket=logs_handler,  # Use logs_handler instead of raw websocket
+                headers=headers,
+                mcp_configs=mcp_configs if mcp_enabled else None,
+                mcp_strategy=mcp_strategy if mcp_enabled else None,
+            )
+            report = await researcher.run()
         
-    else:
-        researcher = BasicReport(
-            query=task,
-            query_domains=query_domains,
-            report_type=report_type,
-            report_source=report_source,
-            source_urls=source_urls,
-            document_urls=document_urls,
-            tone=tone,
-            config_path=config_path,
-            websocket=logs_handler,  # Use logs_handler instead of raw websocket
-            headers=headers,
-            mcp_configs=mcp_configs if mcp_enabled else None,
-            mcp_strategy=mcp_strategy if mcp_enabled else None,
-        )
-        report = await researcher.run()
+        else:
+            researcher = BasicReport(
+                query=task,
+                query_domains=query_domains,
+                report_type=report_type,
+                report_source=report_source,
+                source_urls=source_urls,
+                document_urls=document_urls,
+                tone=tone,
+                config_path=config_path,
+                websocket=logs_handler,  # Use logs_handler instead of raw websocket
+                headers=headers,
+                mcp_configs=mcp_configs if mcp_enabled else None,
+                mcp_strategy=mcp_strategy if mcp_enabled else None,
+            )
+            report = await researcher.run()
+
+    finally:
+        # Persist the complete log before the report files read it back, and never
+        # leave the delayed flush or the events sidecar behind when the run fails
+        await logs_handler.close()
 
     if return_researcher:
         return report, researcher.gpt_researcher
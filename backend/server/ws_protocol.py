@@ -0,0 +1,20 @@
+from uvicorn.protocols.websockets.websockets_impl import WebSocketProtocol
+from websockets.extensions.permessage_deflate import ServerPerMessageDeflateFactory
+
+
+class NoContextTakeoverWebSocketProtocol(WebSocketProtocol):
+    """
+    uvicorn websockets protocol that negotiates permessage-deflate without
+    context takeover, so each connection does not keep a compression window
+    alive between messages.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.config.ws_per_message_deflate:
+            self.available_extensions = [
+                ServerPerMessageDeflateFactory(
+                    server_no_context_takeover=True,
+                    client_no_context_takeover=True,
+                )
+            ]
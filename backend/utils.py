@@ -1,7 +1,31 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional, Union
 import aiofiles
 import urllib
 import mistune
 
+# Persistent worker processes for the CPU-bound DOCX/PDF rendering, created on first use
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """Returns the shared render process pool, creating it if needed."""
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = ProcessPoolExecutor(max_workers=2, initializer=_preload_renderers)
+    return _render_pool
+
+def shutdown_render_pool() -> None:
+    """Stops the render worker processes."""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=False, cancel_futures=True)
+        _render_pool = None
+
+async def _run_in_render_pool(fn, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_render_pool(), fn, *args)
+
 async def write_to_file(filename: str, text: str) -> None:
     """Asynchronously write text to a file in UTF-8 encoding.
 
@@ -32,29 +56,30 @@ async def write_text_to_md(text: str, filename: str = "") -> str:
     await write_to_file(file_path, text)
     return urllib.parse.quote(file_path)
 
-async def write_md_to_pdf(text: str, filename: str = "") -> str:
+async def write_md_to_pdf(text: str, filename: str = "", docx_path: str = "") -> str:
     """Converts Markdown text to a PDF file and returns the file path.
     First converts to DOCX, then to PDF.
 
     Args:
         text (str): Markdown text to convert.
+        docx_path (str): Encoded path of an already rendered DOCX of the text, if any.
 
     Returns:
         str: The encoded file path of the generated PDF.
     """
     try:
-        # First convert markdown to docx
-        docx_path = await write_md_to_word(text, filename)
+        # First convert markdown to docx, unless the caller already did
+        if not docx_path:
+            docx_path = await write_md_to_word(text, filename)
         if not docx_path:
             return ""
             
         # Now convert docx to pdf
-        from docx2pdf import convert
         pdf_path = f"outputs/{filename[:60]}.pdf"
         
         # Convert the decoded file path
         decoded_docx_path = urllib.parse.unquote(docx_path)
-        convert(decoded_docx_path, pdf_path)
+        await _run_in_render_pool(_convert_docx_to_pdf, decoded_docx_path, pdf_path)
         
         print(f"Report written to {pdf_path}")
         encoded_file_path = urllib.parse.quote(pdf_path)
@@ -76,17 +101,8 @@ async def write_md_to_word(text: str, filename: str = "") -> str:
     file_path = f"outputs/{filename[:60]}.docx"
 
     try:
-        from docx import Document
-        from htmldocx import HtmlToDocx
-        # Convert report markdown to HTML
-        html = mistune.html(text)
-        # Create a document object
-        doc = Document()
-        # Convert the html generated from the report to document format
-        HtmlToDocx().add_html_to_document(html, doc)
-
-        # Saving the docx document to file_path
-        doc.save(file_path)
+        # Rendering is CPU-bound, keep it off the event loop and the GIL
+        await _run_in_render_pool(_render_md_to_docx, text, file_path)
 
         print(f"Report written to {file_path}")
 
@@ -95,4 +111,55 @@ async def write_md_to_word(text: str, filename: str = "") -> str:
 
     except Exception as e:
         print(f"Error in converting Markdown to DOCX: {e}")
-        return ""
\ No newline at end of file
+        return ""
+
+async def send_report_stream(websocket, report: Union[str, Iterable[str]], chunk_size: int = 16384) -> None:
+    """Sends a report over the websocket in ordered chunks instead of one large frame.
+
+    Args:
+        websocket: The websocket (or logs handler) to send through.
+        report (str | Iterable[str]): The report text, or the report as ordered pieces.
+        chunk_size (int): Maximum number of characters per chunk.
+    """
+    pieces = [report] if isinstance(report, str) else report
+    seq = 0
+    await websocket.send_json({"type": "report_begin"})
+    for piece in pieces:
+        for i in range(0, len(piece), chunk_size):
+            await websocket.send_json({
+                "type": "report_chunk",
+                "seq": seq,
+                "output": piece[i:i + chunk_size]
+            })
+            seq += 1
+            # Yield so other tasks can run between chunks
+            await asyncio.sleep(0)
+    await websocket.send_json({"type": "report_end"})
+
+def _preload_renderers() -> None:
+    """Imports the rendering libraries once per worker process."""
+    import docx  # noqa: F401
+    import htmldocx  # noqa: F401
+    try:
+        import docx2pdf  # noqa: F401
+    except ImportError:
+        pass
+
+def _convert_docx_to_pdf(docx_path: str, pdf_path: str) -> None:
+    """Converts the DOCX file at docx_path into a PDF at pdf_path."""
+    from docx2pdf import convert
+    convert(docx_path, pdf_path)
+
+def _render_md_to_docx(text: str, file_path: str) -> None:
+    """Renders Markdown text into a DOCX file at file_path."""
+    from docx import Document
+    from htmldocx import HtmlToDocx
+    # Convert report markdown to HTML
+    html = mistune.html(text)
+    # Create a document object
+    doc = Document()
+    # Convert the html generated from the report to document format
+    HtmlToDocx().add_html_to_document(html, doc)
+
+    # Saving the docx document to file_path
+    doc.save(file_path)
@@ -1149,7 +1149,7 @@ const GPTResearcher = (() => {
     // Send stop signal to backend BEFORE closing socket
     try {
       if (socket && socket.readyState === WebSocket.OPEN) {
-        socket.send(`stop ${JSON.stringify({ reason: 'user_request' })}`);
+        socket.send(encodeCommand('stop', { reason: 'user_request' }));
         console.log('Stop signal sent to backend');
       }
     } catch (e) {
@@ -1213,6 +1213,11 @@ const GPTResearcher = (() => {
     }, 150); // 150ms delay to ensure stop signal is sent
   }
 
+  // Commands go out as binary JSON envelopes, the server parses the bytes directly
+  const commandEncoder = new TextEncoder();
+  const encodeCommand = (op, payload) =>
+    commandEncoder.encode(JSON.stringify({ op: op, payload: payload }));
+
   const listenToSockEvents = () => {
     const { protocol, host, pathname } = window.location
     const ws_uri = `${protocol === 'https:' ? 'wss:' : 'ws:'
@@ -1255,6 +1260,7 @@ const GPTResearcher = (() => {
     socket = new WebSocket(ws_uri)
     let reportContent = ''; // Store the report content for history
     let downloadLinkData = null; // Store download links
+    let reportChunks = []; // Chunks of a report streamed in pieces
 
     socket.onmessage = (event) => {
       // Reset reconnect attempts on successful message
@@ -1268,9 +1274,34 @@ const GPTResearcher = (() => {
       lastActivityTime = Date.now();
       updateWebSocketStatus();
 
+      handleSocketMessage(data);
+    }
+
+    const handleSocketMessage = (data) => {
       // Get the current report_type
       const report_type = document.querySelector('select[name="report_type"]').value;
 
+      // Batched log messages are handled one by one
+      if (data.type === 'logs_batch') {
+        (data.output || []).forEach((entry) => handleSocketMessage(entry));
+        return;
+      }
+
+      // Reports may be streamed in chunks; reassemble them by sequence number
+      if (data.type === 'report_begin') {
+        reportChunks = [];
+        return;
+      }
+      if (data.type === 'report_chunk') {
+        reportChunks[data.seq] = data.output;
+        return;
+      }
+      if (data.type === 'report_end') {
+        const output = reportChunks.join('');
+        reportChunks = [];
+        handleSocketMessage({ type: 'report', output: output });
+        return;
+      }
 
       // Handle all log messages for research progress
       if (data.type === 'logs') {
@@ -1481,7 +1512,7 @@ const GPTResearcher = (() => {
       // Store the request data for potential reconnection
       lastRequestData = requestData;
 
-      socket.send(`start ${JSON.stringify(requestData)}`)
+      socket.send(encodeCommand('start', requestData))
     }
 
     socket.onclose = (event) => {
@@ -2350,7 +2381,7 @@ const GPTResearcher = (() => {
     const loadingId = addLoadingIndicator();
 
     // Prepare the message to send
-    const messageToSend = `chat ${JSON.stringify({ message: message })}`;
+    const messageToSend = encodeCommand('chat', { message: message });
 
     // Send message through WebSocket
     if (socket && socket.readyState === WebSocket.OPEN) {
@@ -3,7 +3,7 @@ from .query_processing import plan_research_outline, get_search_results
 from .agent_creator import extract_json_with_regex, choose_agent
 from .web_scraping import scrape_urls
 from .report_generation import write_conclusion, summarize_url, generate_draft_section_titles, generate_report, write_report_introduction
-from .markdown_processing import extract_headers, extract_sections, table_of_contents, add_references
+from .markdown_processing import extract_headers, extract_sections, extract_headers_and_sections, table_of_contents, table_of_contents_from_headers, iter_report_chunks, add_references
 from .utils import stream_output
 
 __all__ = [
@@ -20,7 +20,10 @@ __all__ = [
     "write_report_introduction",
     "extract_headers",
     "extract_sections",
+    "extract_headers_and_sections",
     "table_of_contents",
+    "table_of_contents_from_headers",
+    "iter_report_chunks",
     "add_references",
     "stream_output",
     "choose_agent"
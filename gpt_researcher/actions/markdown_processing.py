@@ -1,6 +1,6 @@
 import re
 import markdown
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 def extract_headers(markdown_text: str) -> List[Dict]:
     """
@@ -12,8 +12,40 @@ def extract_headers(markdown_text: str) -> List[Dict]:
     Returns:
         List[Dict]: A list of dictionaries representing the header structure.
     """
-    headers = []
+    return _headers_from_html(markdown.markdown(markdown_text))
+
+def extract_sections(markdown_text: str) -> List[Dict[str, str]]:
+    """
+    Extract all written sections from subtopic report.
+
+    Args:
+        markdown_text (str): Subtopic report text.
+
+    Returns:
+        List[Dict[str, str]]: List of sections, each section is a dictionary containing
+        'section_title' and 'written_content'.
+    """
+    return _sections_from_html(markdown.markdown(markdown_text))
+
+def extract_headers_and_sections(markdown_text: str) -> Tuple[List[Dict], List[Dict[str, str]]]:
+    """
+    Extract both the header structure and the written sections, parsing the markdown once.
+
+    Args:
+        markdown_text (str): The markdown text to process.
+
+    Returns:
+        Tuple[List[Dict], List[Dict[str, str]]]: The same results as extract_headers
+        and extract_sections.
+    """
     parsed_md = markdown.markdown(markdown_text)
+    return _headers_from_html(parsed_md), _sections_from_html(parsed_md)
+
+_SECTION_PATTERN = re.compile(r'<h\d>(.*?)</h\d>(.*?)(?=<h\d>|$)', re.DOTALL)
+_TAG_PATTERN = re.compile(r'<.*?>')
+
+def _headers_from_html(parsed_md: str) -> List[Dict]:
+    headers = []
     lines = parsed_md.split("\n")
 
     stack = []
@@ -38,25 +70,10 @@ def extract_headers(markdown_text: str) -> List[Dict]:
 
     return headers
 
-def extract_sections(markdown_text: str) -> List[Dict[str, str]]:
-    """
-    Extract all written sections from subtopic report.
-
-    Args:
-        markdown_text (str): Subtopic report text.
-
-    Returns:
-        List[Dict[str, str]]: List of sections, each section is a dictionary containing
-        'section_title' and 'written_content'.
-    """
+def _sections_from_html(parsed_md: str) -> List[Dict[str, str]]:
     sections = []
-    parsed_md = markdown.markdown(markdown_text)
-    
-    pattern = r'<h\d>(.*?)</h\d>(.*?)(?=<h\d>|$)'
-    matches = re.findall(pattern, parsed_md, re.DOTALL)
-    
-    for title, content in matches:
-        clean_content = re.sub(r'<.*?>', '', content).strip()
+    for title, content in _SECTION_PATTERN.findall(parsed_md):
+        clean_content = _TAG_PATTERN.sub('', content).strip()
         if clean_content:
             sections.append({
                 "section_title": title.strip(),
@@ -75,22 +92,74 @@ def table_of_contents(markdown_text: str) -> str:
     Returns:
         str: The generated table of contents.
     """
-    def generate_table_of_contents(headers, indent_level=0):
-        toc = ""
-        for header in headers:
-            toc += " " * (indent_level * 4) + "- " + header["text"] + "\n"
-            if "children" in header:
-                toc += generate_table_of_contents(header["children"], indent_level + 1)
-        return toc
-
     try:
-        headers = extract_headers(markdown_text)
-        toc = "## Table of Contents\n\n" + generate_table_of_contents(headers)
-        return toc
+        return _render_table_of_contents(extract_headers(markdown_text))
     except Exception as e:
         print("table_of_contents Exception : ", e)
         return markdown_text
 
+def table_of_contents_from_headers(header_groups: Iterable[List[Dict]]) -> str:
+    """
+    Generate a table of contents from header structures already extracted per report part,
+    re-nested as if the headers were parsed from the concatenated parts.
+
+    Args:
+        header_groups (Iterable[List[Dict]]): Header structures as returned by extract_headers, in report order.
+
+    Returns:
+        str: The generated table of contents.
+    """
+    def flatten(headers: List[Dict]) -> Iterator[Dict]:
+        for header in headers:
+            yield header
+            yield from flatten(header.get("children", []))
+
+    toc_headers: List[Dict] = []
+    stack: List[Dict] = []
+    for headers in header_groups:
+        for header in flatten(headers):
+            while stack and stack[-1]["level"] >= header["level"]:
+                stack.pop()
+            node = {"level": header["level"], "text": header["text"], "children": []}
+            (stack[-1]["children"] if stack else toc_headers).append(node)
+            stack.append(node)
+
+    return _render_table_of_contents(toc_headers)
+
+def _render_table_of_contents(headers: List[Dict]) -> str:
+    lines = ["## Table of Contents\n\n"]
+
+    def add_lines(headers: List[Dict], indent_level: int = 0) -> None:
+        for header in headers:
+            lines.append(" " * (indent_level * 4) + "- " + header["text"] + "\n")
+            add_lines(header.get("children", []), indent_level + 1)
+
+    add_lines(headers)
+    return "".join(lines)
+
+def iter_report_chunks(introduction: str, toc: str, sections: Iterable[str], conclusion: str) -> Iterator[str]:
+    """
+    Yield a report assembled from its parts piece by piece, without concatenating the sections.
+
+    Args:
+        introduction (str): The report introduction.
+        toc (str): The table of contents.
+        sections (Iterable[str]): The report body parts, in order.
+        conclusion (str): The conclusion, with references.
+
+    Returns:
+        Iterator[str]: The report chunks, which join to the full report.
+    """
+    yield introduction
+    yield "\n\n"
+    yield toc
+    yield "\n\n"
+    for section in sections:
+        yield "\n\n\n"
+        yield section
+    yield "\n\n"
+    yield conclusion
+
 def add_references(report_markdown: str, visited_urls: set) -> str:
     """
     Add references to the markdown report.
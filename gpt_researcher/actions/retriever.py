@@ -1,3 +1,18 @@
+import importlib
+
+# Retriever name -> class name exported by gpt_researcher.retrievers
+_RETRIEVER_CLASS_NAMES = {
+    "searchapi": "SearchApiSearch",
+    "duckduckgo": "Duckduckgo",
+    "arxiv": "ArxivSearch",
+    "custom": "CustomRetriever",
+    "mcp": "MCPRetriever",
+}
+
+# Retriever classes resolved so far, filled on first use of each name
+_RETRIEVERS: dict[str, type] = {}
+
+
 def get_retriever(retriever: str):
     """
     Gets the retriever
@@ -8,30 +23,21 @@ def get_retriever(retriever: str):
         retriever: Retriever class
 
     """
-    match retriever:
-        case "searchapi":
-            from gpt_researcher.retrievers import SearchApiSearch
-
-            return SearchApiSearch
-        case "duckduckgo":
-            from gpt_researcher.retrievers import Duckduckgo
+    retriever_class = _RETRIEVERS.get(retriever)
+    if retriever_class is not None:
+        return retriever_class
 
-            return Duckduckgo
-        case "arxiv":
-            from gpt_researcher.retrievers import ArxivSearch
+    class_name = _RETRIEVER_CLASS_NAMES.get(retriever)
+    if class_name is None:
+        return None
 
-            return ArxivSearch
-        case "custom":
-            from gpt_researcher.retrievers import CustomRetriever
-
-            return CustomRetriever
-        case "mcp":
-            from gpt_researcher.retrievers import MCPRetriever
-
-            return MCPRetriever
-
-        case _:
-            return None
+    retrievers_module = importlib.import_module("gpt_researcher.retrievers")
+    try:
+        retriever_class = getattr(retrievers_module, class_name)
+    except AttributeError:
+        raise ImportError(f"cannot import name '{class_name}' from 'gpt_researcher.retrievers'")
+    _RETRIEVERS[retriever] = retriever_class
+    return retriever_class
 
 
 def get_retrievers(headers: dict[str, str], cfg):
@@ -45,6 +51,8 @@ def get_retrievers(headers: dict[str, str], cfg):
     Returns:
         list: A list of retriever classes to be used for searching.
     """
+    default_retriever = get_default_retriever()
+
     # Check headers first for multiple retrievers
     if headers.get("retrievers"):
         retrievers = headers.get("retrievers").split(",")
@@ -53,28 +61,22 @@ def get_retrievers(headers: dict[str, str], cfg):
         retrievers = [headers.get("retriever")]
     # If not in headers, check config for multiple retrievers
     elif cfg.retrievers:
-        # Handle both list and string formats for config retrievers
-        if isinstance(cfg.retrievers, str):
-            retrievers = cfg.retrievers.split(",")
-        else:
-            retrievers = cfg.retrievers
-        # Strip whitespace from each retriever name
+        # Handle both list and string formats for config retrievers, stripping whitespace from each name
+        retrievers = cfg.retrievers.split(",") if isinstance(cfg.retrievers, str) else cfg.retrievers
         retrievers = [r.strip() for r in retrievers]
     # If not found, check config for a single retriever
     elif cfg.retriever:
         retrievers = [cfg.retriever]
     # If still not set, use default retriever
     else:
-        retrievers = [get_default_retriever().__name__]
+        retrievers = [default_retriever.__name__]
 
     # Convert retriever names to actual retriever classes
-    # Use get_default_retriever() as a fallback for any invalid retriever names
-    retriever_classes = [get_retriever(r) or get_default_retriever() for r in retrievers]
+    # Use the default retriever as a fallback for any invalid retriever names
+    retriever_classes = [get_retriever(r) or default_retriever for r in retrievers]
     
     return retriever_classes
 
 
 def get_default_retriever():
-    from gpt_researcher.retrievers import Duckduckgo
-
-    return Duckduckgo
\ No newline at end of file
+    return get_retriever("duckduckgo")
\ No newline at end of file
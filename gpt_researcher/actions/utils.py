@@ -1,5 +1,6 @@
 from typing import Dict, Any, Callable
 from ..utils.logger import get_formatted_logger
+from ..utils.websocket import send_json
 
 logger = get_formatted_logger()
 
@@ -26,9 +27,10 @@ async def stream_output(
             logger.info(f"{sanitized_output}")
 
     if websocket:
-        await websocket.send_json(
+        await send_json(
+            websocket,
             {"type": type, "content": content,
-                "output": output, "metadata": metadata}
+                "output": output, "metadata": metadata},
         )
 
 
@@ -44,7 +46,7 @@ async def safe_send_json(websocket: Any, data: Dict[str, Any]) -> None:
         None
     """
     try:
-        await websocket.send_json(data)
+        await send_json(websocket, data)
     except Exception as e:
         logger.error(f"Error sending JSON through WebSocket: {e}")
 
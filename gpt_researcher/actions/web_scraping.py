@@ -1,16 +1,20 @@
+import asyncio
 from typing import Any
 from colorama import Fore, Style
 
-from gpt_researcher.utils.workers import WorkerPool
+from gpt_researcher.utils.workers import WorkerPool, get_process_pool
 from ..scraper import Scraper
+from ..scraper.cache import canonicalize_url
+from ..scraper.dedup import drop_near_duplicates
 from ..config.config import Config
 from ..utils.logger import get_formatted_logger
+from ..utils.websocket import send_json
 
 logger = get_formatted_logger()
 
 
 async def scrape_urls(
-    urls, cfg: Config, worker_pool: WorkerPool, websocket=None
+    urls, cfg: Config, worker_pool: WorkerPool, websocket=None, session=None, in_flight=None
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Scrapes the urls with detailed logging support
@@ -19,6 +23,8 @@ async def scrape_urls(
         cfg: Config
         worker_pool: Worker pool for async operations
         websocket: WebSocket for logging (optional)
+        session: Shared aiohttp session to reuse (optional)
+        in_flight: Scrapes in progress by canonical URL, shared across calls (optional)
 
     Returns:
         tuple[list[dict[str, Any]], list[dict[str, Any]]]: tuple containing scraped content and placeholder for backwards compatibility
@@ -32,8 +38,13 @@ async def scrape_urls(
 
     try:
         # Pass websocket to scraper for detailed logging
-        scraper = Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool, websocket=websocket)
-        scraped_data = await scraper.run()
+        scraper = Scraper(
+            urls, user_agent, cfg.scraper, worker_pool=worker_pool, websocket=websocket, session=session,
+            max_page_bytes=cfg.max_page_bytes, in_flight=in_flight,
+        )
+        # Pages arrive as they finish, not after the slowest URL
+        async for content in scraper.stream():
+            scraped_data.append(content)
         
         # Log summary
         if websocket:
@@ -42,7 +53,7 @@ async def scrape_urls(
                 successful_scrapes = len(scraped_data)
                 failed_scrapes = total_urls - successful_scrapes
                 
-                await websocket.send_json({
+                await send_json(websocket, {
                     "type": "logs",
                     "content": "scraping_complete",
                     "output": f"📊 Scraping complete: {successful_scrapes}/{total_urls} successful, {failed_scrapes} failed"
@@ -55,7 +66,7 @@ async def scrape_urls(
         
         if websocket:
             try:
-                await websocket.send_json({
+                await send_json(websocket, {
                     "type": "logs",
                     "content": "error",
                     "output": f"❌ Error in scraping process: {e}"
@@ -66,22 +77,26 @@ async def scrape_urls(
     return scraped_data, []  # Return empty list for images as they are no longer supported
 
 
-async def filter_urls(urls: list[str], config: Config) -> list[str]:
+async def filter_urls(urls: list[str], config: Config, seen: set[str] | None = None) -> list[str]:
     """
     Filter URLs based on configuration settings.
 
     Args:
         urls (list[str]): List of URLs to filter.
         config (Config): Configuration object.
+        seen (set[str] | None): Canonical URLs already scraped, these are skipped.
 
     Returns:
         list[str]: Filtered list of URLs.
     """
+    excluded_pattern = getattr(config, "excluded_domains_pattern", None)
     filtered_urls = []
     for url in urls:
+        if seen and canonicalize_url(url) in seen:
+            continue
         # Add your filtering logic here
         # For example, you might want to exclude certain domains or URL patterns
-        if not any(excluded in url for excluded in config.excluded_domains):
+        if excluded_pattern is None or not excluded_pattern.search(url):
             filtered_urls.append(url)
     return filtered_urls
 
@@ -103,6 +118,7 @@ async def extract_main_content(html_content: str) -> str:
 async def process_scraped_data(scraped_data: list[dict[str, Any]], config: Config) -> list[dict[str, Any]]:
     """
     Process the scraped data to extract and clean the main content.
+    Near-duplicate pages (mirrors, syndicated copies) are dropped.
 
     Args:
         scraped_data (list[dict[str, Any]]): List of dictionaries containing scraped data.
@@ -111,15 +127,24 @@ async def process_scraped_data(scraped_data: list[dict[str, Any]], config: Confi
     Returns:
         list[dict[str, Any]]: Processed scraped data.
     """
+    unique_data, _, fingerprints = await drop_near_duplicates(scraped_data, executor=get_process_pool())
+    simhash_by_item = {id(item): fingerprint for item, fingerprint in zip(unique_data, fingerprints)}
+    # Changed from 'status' to 'raw_content' check
+    with_content = [item for item in unique_data if item.get('raw_content')]
+    main_contents = await asyncio.gather(
+        *(extract_main_content(item['raw_content']) for item in with_content)
+    )
+    main_content_by_item = {id(item): content for item, content in zip(with_content, main_contents)}
+
     processed_data = []
-    for item in scraped_data:
-        if item.get('raw_content'):  # Changed from 'status' to 'raw_content' check
-            main_content = await extract_main_content(item['raw_content'])
+    for item in unique_data:
+        if id(item) in main_content_by_item:
             processed_data.append({
                 'url': item['url'],
-                'content': main_content,
+                'content': main_content_by_item[id(item)],
                 'title': item.get('title', ''),
-                'raw_content': item['raw_content']
+                'raw_content': item['raw_content'],
+                'simhash': simhash_by_item[id(item)],
             })
         else:
             processed_data.append(item)
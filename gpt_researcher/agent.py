@@ -318,7 +318,11 @@ class GPTResearcher:
             "agent": self.agent,
             "role": self.role
         })
-        self.context = await self.research_conductor.conduct_research()
+        try:
+            self.context = await self.research_conductor.conduct_research()
+        finally:
+            # Scraping rounds of this research shared one session, release its connections
+            await self.scraper_manager.aclose()
 
         await self._log_event("research", step="research_completed", details={
             "context_length": len(self.context)
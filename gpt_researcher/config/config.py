@@ -1,5 +1,6 @@
 import json
 import os
+import re
 import warnings
 from typing import Dict, Any, List, Union, Type, get_origin, get_args
 
@@ -21,6 +22,7 @@ class Config:
 
         config_to_use = self.load_config(config_path)
         self._set_attributes(config_to_use)
+        self._set_excluded_domains_pattern()
         self._set_embedding_attributes()
         self._set_llm_attributes()
         self._handle_deprecated_attributes()
@@ -52,6 +54,13 @@ class Config:
             print(f"Warning: {str(e)}. Defaulting to 'tavily' retriever.")
             self.retrievers = ["tavily"]
 
+    def _set_excluded_domains_pattern(self) -> None:
+        # One compiled pattern scans each URL once instead of one substring test per domain
+        domains = {domain for domain in self.excluded_domains or [] if domain}
+        self.excluded_domains_pattern = (
+            re.compile("|".join(map(re.escape, domains))) if domains else None
+        )
+
     def _set_embedding_attributes(self) -> None:
         self.embedding_provider, self.embedding_model = self.parse_embedding(
             self.embedding
@@ -22,6 +22,8 @@ DEFAULT_CONFIG: BaseConfig = {
     "AGENT_ROLE": None,
     "SCRAPER": "bs",
     "MAX_SCRAPER_WORKERS": 15,
+    "EXCLUDED_DOMAINS": [],
+    "MAX_PAGE_BYTES": 10 * 1024 * 1024,  # Larger responses are skipped before download
     "MAX_SUBTOPICS": 3,
     "LANGUAGE": "english",
     "REPORT_SOURCE": "web",
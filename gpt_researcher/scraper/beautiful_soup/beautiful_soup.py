@@ -1,44 +1,76 @@
-from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
+import asyncio
+import aiohttp
+import requests
 from urllib.parse import urljoin
-import warnings
 
-# Filter out XMLParsedAsHTMLWarning
-warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
-
-from ..utils import extract_title, get_text_from_soup, clean_soup
+from ..cache import scrape_cache
+from ..utils import parse_page
 
 class BeautifulSoupScraper:
 
     def __init__(self, link, session=None):
         self.link = link
         self.session = session
+        # Validators of the last response, stored with the page for conditional GETs
+        self.etag: str | None = None
+        self.last_modified: str | None = None
 
     def scrape(self):
         """
         This function scrapes content from a webpage by making a GET request, parsing the HTML using
-        BeautifulSoup, and extracting script and style elements before returning the cleaned content.
+        lxml, and extracting script and style elements before returning the cleaned content.
         
         Returns:
           The `scrape` method is returning the cleaned and extracted content from the webpage specified
         by the `self.link` attribute. The method fetches the webpage content, removes script and style
         tags, extracts the text content, and returns the cleaned content as a string. If any exception
         occurs during the process, an error message is printed and an empty string is returned.
+        `self.session` is the aiohttp session used by `scrape_async`, so this blocking path
+        makes its own requests call.
         """
         try:
-            response = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response.content, "lxml", from_encoding=response.encoding
-            )
+            response = requests.get(self.link, timeout=4)
+            return parse_page_bytes(response.content, response.encoding)
 
-            soup = clean_soup(soup)
+        except Exception as e:
+            print("Error! : " + str(e))
+            return "", ""
 
-            content = get_text_from_soup(soup)
-            
-            # Extract the title using the utility function
-            title = extract_title(soup)
+    async def scrape_async(self, executor=None):
+        """
+        Same as `scrape`, but fetches the page with the shared aiohttp session so the download
+        does not tie up a worker. Parsing is CPU-bound, so it runs on `executor` (a process pool
+        when given, the loop's default thread pool otherwise).
+        A previously scraped page is revalidated with If-None-Match / If-Modified-Since and
+        reused as is when the server answers 304.
+        """
+        try:
+            cached = await scrape_cache.get_stale(self.link)
+            headers = {}
+            if cached is not None:
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    headers["If-Modified-Since"] = cached.last_modified
 
-            return content, title
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=4, sock_read=4)
+            async with self.session.get(self.link, timeout=timeout, headers=headers) as response:
+                if response.status == 304 and cached is not None:
+                    self.etag, self.last_modified = cached.etag, cached.last_modified
+                    return cached.content, cached.title
+                body = await response.read()
+                encoding = response.charset
+                self.etag = response.headers.get("ETag")
+                self.last_modified = response.headers.get("Last-Modified")
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, parse_page_bytes, body, encoding)
 
         except Exception as e:
             print("Error! : " + str(e))
-            return "", ""
\ No newline at end of file
+            return "", ""
+
+
+def parse_page_bytes(body: bytes, encoding: str | None):
+    """Extract (content, title) from a downloaded page. Module level so it pickles for process pools."""
+    title, content = parse_page(body, encoding)
+    return content, title
@@ -0,0 +1,78 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so trivially different spellings share a cache entry.
+    Lowercases the scheme and host, drops the fragment and sorts the query.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+
+class CachedPage(NamedTuple):
+    content: str
+    title: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class ScrapeCache:
+    """
+    In-process LRU of scraped pages, keyed on the canonical URL, with per-entry expiry.
+    Expired pages are kept until evicted so they can be revalidated with a conditional GET.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 1800):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, CachedPage]]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def get(self, url: str) -> Optional[Tuple[str, str]]:
+        """Return the cached (content, title) for the URL, or None"""
+        key = canonicalize_url(url)
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, page = entry
+            if expires_at < time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            return page.content, page.title
+
+    async def get_stale(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page for the URL even if expired, or None"""
+        async with self._lock:
+            entry = self._entries.get(canonicalize_url(url))
+            return entry[1] if entry is not None else None
+
+    async def set(
+        self,
+        url: str,
+        content: str,
+        title: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        key = canonicalize_url(url)
+        page = CachedPage(content, title, etag, last_modified)
+        async with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, page)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        async with self._lock:
+            self._entries.clear()
+
+
+# Shared by every Scraper in the process so overlapping sub-queries skip repeat fetches
+scrape_cache = ScrapeCache()
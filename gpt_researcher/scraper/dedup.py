@@ -0,0 +1,89 @@
+import asyncio
+import hashlib
+import re
+from concurrent.futures import Executor
+from typing import Any, Iterable
+
+_TAG_RE = re.compile(r"<[^>]*>")
+_DIGIT_RE = re.compile(r"\d+")
+_WORD_RE = re.compile(r"\w+")
+
+SHINGLE_SIZE = 5
+MAX_HAMMING_DISTANCE = 3
+
+
+def _normalize(text: str) -> list[str]:
+    """Lowercased words with markup and numbers (dates, counters, ids) removed"""
+    text = _DIGIT_RE.sub(" ", _TAG_RE.sub(" ", text))
+    return _WORD_RE.findall(text.lower())
+
+
+def _hash64(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash of a page over word 5-gram shingles.
+    Pages that differ only in boilerplate, markup or dates land a few bits apart.
+    """
+    words = _normalize(text)
+    if len(words) < SHINGLE_SIZE:
+        shingles = {" ".join(words)}
+    else:
+        shingles = {
+            " ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)
+        }
+    hashes = [_hash64(shingle) for shingle in shingles]
+    half = len(hashes) / 2
+    fingerprint = 0
+    for bit in range(64):
+        if sum((h >> bit) & 1 for h in hashes) > half:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def simhashes(texts: list[str]) -> list[int]:
+    """Fingerprint a batch of pages in one call. Module level so it pickles for process pools."""
+    return [simhash(text) for text in texts]
+
+
+async def drop_near_duplicates(
+    items: Iterable[dict[str, Any]],
+    key: str = "raw_content",
+    max_distance: int = MAX_HAMMING_DISTANCE,
+    executor: Executor | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[int | None]]:
+    """
+    Keep the first page of every group of near-identical pages.
+    Fingerprinting is CPU-bound, so it runs on `executor` (a process pool when given,
+    the loop's default thread pool otherwise). The items themselves are left untouched.
+
+    Returns:
+        tuple: (kept items, dropped near-duplicates, fingerprint of each kept item or None when it has no text)
+    """
+    items = list(items)
+    with_text = [item for item in items if item.get(key)]
+    fingerprints = []
+    if with_text:
+        fingerprints = await asyncio.get_running_loop().run_in_executor(
+            executor, simhashes, [item[key] for item in with_text]
+        )
+    fingerprint_by_item = {id(item): fingerprint for item, fingerprint in zip(with_text, fingerprints)}
+
+    kept, dropped, kept_fingerprints = [], [], []
+    accepted: list[int] = []
+    for item in items:
+        fingerprint = fingerprint_by_item.get(id(item))
+        if fingerprint is not None:
+            if any(hamming_distance(fingerprint, seen) <= max_distance for seen in accepted):
+                dropped.append(item)
+                continue
+            accepted.append(fingerprint)
+        kept.append(item)
+        kept_fingerprints.append(fingerprint)
+    return kept, dropped, kept_fingerprints
@@ -1,8 +1,8 @@
-import os
+import asyncio
+import aiohttp
+import pymupdf
 import requests
-import tempfile
 from urllib.parse import urlparse
-from langchain_community.document_loaders import PyMuPDFLoader
 
 
 class PyMuPDFScraper:
@@ -13,7 +13,7 @@ class PyMuPDFScraper:
 
         Args:
           link (str): The URL or local file path of the PDF document.
-          session (requests.Session, optional): An optional session for making HTTP requests.
+          session (aiohttp.ClientSession, optional): Shared session used by `scrape_async`.
         """
         self.link = link
         self.session = session
@@ -31,39 +31,65 @@ class PyMuPDFScraper:
         except Exception:
             return False
 
-    def scrape(self) -> tuple[str, list[str], str]:
+    def scrape(self) -> tuple[str, str]:
         """
-        The `scrape` function uses PyMuPDFLoader to load a document from the provided link (either URL or local file)
-        and returns the document as a string.
+        The `scrape` function loads a document with PyMuPDF from the provided link (either URL or local file)
+        and returns its text and title.
 
         Returns:
-          str: A string representation of the loaded document.
+          tuple[str, str]: The text of the first page and the document title.
         """
         try:
             if self.is_url():
-                response = requests.get(self.link, timeout=5, stream=True)
+                response = requests.get(self.link, timeout=5)
                 response.raise_for_status()
+                return extract_pdf_text(response.content)
+            return extract_pdf_file_text(self.link)
 
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-                    temp_filename = temp_file.name  # Get the temporary file name
-                    for chunk in response.iter_content(chunk_size=8192):
-                        temp_file.write(chunk)  # Write the downloaded content to the temporary file
-
-                loader = PyMuPDFLoader(temp_filename)
-                doc = loader.load()
+        except requests.exceptions.Timeout:
+            print(f"Download timed out. Please check the link : {self.link}")
+            return "", ""
+        except Exception as e:
+            print(f"Error loading PDF : {self.link} {e}")
+            return "", ""
 
-                os.remove(temp_filename)
-            else:
-                loader = PyMuPDFLoader(self.link)
-                doc = loader.load()
+    async def scrape_async(self, executor=None) -> tuple[str, str]:
+        """
+        Same as `scrape`, but downloads the PDF with the shared aiohttp session and opens it
+        from memory, no temporary file. Text extraction is CPU-bound, so it runs on `executor`
+        (a process pool when given, the loop's default thread pool otherwise).
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            if not self.is_url():
+                return await loop.run_in_executor(executor, extract_pdf_file_text, self.link)
 
-            # Extract the content and title from the document.
-            # Retrieve the content of the first page to minimize embedding costs.
-            return doc[0].page_content, doc[0].metadata["title"]
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=5)
+            async with self.session.get(self.link, timeout=timeout) as response:
+                response.raise_for_status()
+                data = await response.read()
+            return await loop.run_in_executor(executor, extract_pdf_text, data)
 
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             print(f"Download timed out. Please check the link : {self.link}")
-            return "", [], ""
+            return "", ""
         except Exception as e:
             print(f"Error loading PDF : {self.link} {e}")
-            return "", [], ""
+            return "", ""
+
+
+def _first_page_text(doc) -> tuple[str, str]:
+    # Retrieve the content of the first page to minimize embedding costs.
+    return doc[0].get_text(), (doc.metadata or {}).get("title", "")
+
+
+def extract_pdf_text(data: bytes) -> tuple[str, str]:
+    """Extract (content, title) from PDF bytes. Module level so it pickles for process pools."""
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        return _first_page_text(doc)
+
+
+def extract_pdf_file_text(path: str) -> tuple[str, str]:
+    """Extract (content, title) from a local PDF. Module level so it pickles for process pools."""
+    with pymupdf.open(path) as doc:
+        return _first_page_text(doc)
@@ -1,13 +1,16 @@
 import asyncio
+import aiohttp
+from aiohttp.resolver import AsyncResolver
 from colorama import Fore, init
-import requests
 import subprocess
 import sys
 import importlib
 import logging
 
+from gpt_researcher.utils.websocket import send_json
 from gpt_researcher.utils.workers import WorkerPool
 
+from .cache import canonicalize_url, scrape_cache
 from . import (
     ArxivScraper,
     BeautifulSoupScraper,
@@ -15,12 +18,50 @@ from . import (
 )
 
 
+def create_http_session(user_agent: str, max_connections: int, keepalive_timeout: float = 30) -> aiohttp.ClientSession:
+    """
+    Create a pooled aiohttp session for scraping. Must be called from a running event loop.
+    Host lookups go through aiodns when it is installed, so they never block the loop.
+    Args:
+        user_agent: User agent string sent with every request
+        max_connections: Maximum number of open connections
+        keepalive_timeout: Seconds an idle connection is kept for reuse
+    """
+    try:
+        resolver = AsyncResolver()
+    except RuntimeError:
+        # aiodns is not installed, keep aiohttp's threaded getaddrinfo resolver
+        resolver = None
+    connector = aiohttp.TCPConnector(
+        resolver=resolver,
+        limit=max_connections,
+        limit_per_host=8,
+        use_dns_cache=True,
+        ttl_dns_cache=300,
+        keepalive_timeout=keepalive_timeout,
+    )
+    return aiohttp.ClientSession(connector=connector, headers={"User-Agent": user_agent})
+
+
+# Queued to tell the websocket writer task to stop
+_WS_CLOSE = object()
+_LOG_SEPARATOR = "=" * 50
+
+# Content types worth downloading, anything else (video, archives, images) is skipped
+_HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+_PDF_CONTENT_TYPE = "application/pdf"
+DEFAULT_MAX_PAGE_BYTES = 10 * 1024 * 1024
+
+
 class Scraper:
     """
     Scraper class to extract the content from the links with detailed logging
     """
 
-    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool, websocket=None):
+    def __init__(
+        self, urls, user_agent, scraper, worker_pool: WorkerPool, websocket=None, session=None,
+        max_page_bytes: int = DEFAULT_MAX_PAGE_BYTES, in_flight: dict[str, asyncio.Future] | None = None,
+    ):
         """
         Initialize the Scraper class.
         Args:
@@ -29,182 +70,312 @@ class Scraper:
             scraper: Scraper type
             worker_pool: Worker pool for async operations
             websocket: WebSocket for logging (optional)
+            session: Shared aiohttp session to reuse (optional), it is left open after the run
+            max_page_bytes: Pages announcing a larger Content-Length are skipped
+            in_flight: Map of scrapes in progress to share with other scrapers (optional)
         """
         self.urls = urls
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})
+        self.user_agent = user_agent
+        self.session: aiohttp.ClientSession | None = session
+        self._owns_session = session is None
         self.scraper = scraper
         self.logger = logging.getLogger(__name__)
         self.worker_pool = worker_pool
         self.websocket = websocket
+        self.max_page_bytes = max_page_bytes
+        # Progress events go through one writer task so scraping never waits on a send
+        self._ws_queue: asyncio.Queue = asyncio.Queue()
+        self._ws_task: asyncio.Task | None = None
+        # Scrapes in progress by canonical URL, so duplicate links share one fetch
+        self._in_flight: dict[str, asyncio.Future] = in_flight if in_flight is not None else {}
+
+    async def __aenter__(self):
+        if self.session is None:
+            self.session = create_http_session(self.user_agent, self.worker_pool.max_workers)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _emit(self, event: dict) -> None:
+        """Queue a websocket event, the writer task sends them in order"""
+        if not self.websocket:
+            return
+        if self._ws_task is None or self._ws_task.done():
+            self._ws_task = asyncio.create_task(self._ws_writer())
+        self._ws_queue.put_nowait(event)
+
+    async def _ws_writer(self) -> None:
+        while True:
+            events = [await self._ws_queue.get()]
+            # Drain whatever else is already queued
+            while not self._ws_queue.empty():
+                events.append(self._ws_queue.get_nowait())
+            for event in events:
+                if event is _WS_CLOSE:
+                    return
+                try:
+                    await send_json(self.websocket, event)
+                except Exception as e:
+                    self.logger.warning(f"Error sending websocket message: {e}")
+
+    async def _close_ws_writer(self) -> None:
+        """Send everything still queued and stop the writer task"""
+        if self._ws_task is None or self._ws_task.done():
+            return
+        self._ws_queue.put_nowait(_WS_CLOSE)
+        await self._ws_task
+        self._ws_task = None
+
+    async def stream(self):
+        """
+        Extracts the content from the links, yielding each page with content as soon as it is
+        scraped, and logs detailed information
+        """
+        scraped_sites = []
+        try:
+            async with self:
+                tasks = [
+                    asyncio.create_task(self.extract_data_from_url(url, self.session))
+                    for url in self.urls
+                ]
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        content = await next_done
+                        scraped_sites.append(self._summarize(content))
+                        if content["raw_content"] is not None:
+                            yield content
+                finally:
+                    # Only does anything when the consumer stops early
+                    for task in tasks:
+                        task.cancel()
+
+            # Send scraped data summary to websocket for logging
+            self._emit({
+                "type": "scraped_data",
+                "scraped_sites": scraped_sites
+            })
+        finally:
+            await self._close_ws_writer()
 
     async def run(self):
         """
         Extracts the content from the links and logs detailed information
         """
-        contents = await asyncio.gather(
-            *(self.extract_data_from_url(url, self.session) for url in self.urls)
-        )
-
-        res = [content for content in contents if content["raw_content"] is not None]
-        
-        # Send scraped data summary to websocket for logging
-        if self.websocket:
-            try:
-                scraped_sites = []
-                for content in contents:
-                    url = content.get("url")
-                    raw_content = content.get("raw_content")
-                    title = content.get("title", "")
-                    
-                    # Determine if the site was used
-                    used = raw_content is not None and len(raw_content) >= 100
-                    skip_reason = ""
-                    
-                    if not used:
-                        if raw_content is None:
-                            skip_reason = "Scraping failed or content unavailable"
-                        elif len(raw_content) < 100:
-                            skip_reason = f"Content too short ({len(raw_content)} characters)"
-                    
-                    scraped_sites.append({
-                        "url": url,
-                        "used": used,
-                        "skip_reason": skip_reason,
-                        "title": title,
-                        "content_length": len(raw_content) if raw_content else 0
-                    })
-                
-                await self.websocket.send_json({
-                    "type": "scraped_data",
-                    "scraped_sites": scraped_sites
-                })
-            except Exception as e:
-                self.logger.error(f"Error sending scraped data to websocket: {e}")
-        
-        return res
+        return [content async for content in self.stream()]
+
+    @staticmethod
+    def _summarize(content) -> dict:
+        """Describe a scraped page for the scraped_data log without its content"""
+        raw_content = content.get("raw_content")
+
+        # Determine if the site was used
+        used = raw_content is not None and len(raw_content) >= 100
+        skip_reason = ""
+
+        if not used:
+            if raw_content is None:
+                skip_reason = "Scraping failed or content unavailable"
+            elif len(raw_content) < 100:
+                skip_reason = f"Content too short ({len(raw_content)} characters)"
+
+        return {
+            "url": content.get("url"),
+            "used": used,
+            "skip_reason": skip_reason,
+            "title": content.get("title", ""),
+            "content_length": len(raw_content) if raw_content else 0
+        }
 
     async def extract_data_from_url(self, link, session):
         """
-        Extracts the data from the link with detailed logging
+        Extracts the data from the link with detailed logging.
+        A link already being scraped waits for that result instead of fetching it again.
         """
-        async with self.worker_pool.throttle():
+        key = canonicalize_url(link)
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
             try:
-                # Log scraping attempt
-                if self.websocket:
-                    try:
-                        await self.websocket.send_json({
-                            "type": "logs",
-                            "content": "scraping",
-                            "output": f"🔍 Scraping: {link}"
-                        })
-                    except Exception as e:
-                        self.logger.warning(f"Error sending websocket message: {e}")
-                
-                Scraper = self.get_scraper(link)
-                scraper = Scraper(link, session)
-
-                # Get scraper name
-                scraper_name = scraper.__class__.__name__
-                self.logger.info(f"\n=== Using {scraper_name} for {link} ===")
-
-                # Get content
-                if hasattr(scraper, "scrape_async"):
-                    content, title = await scraper.scrape_async()
-                else:
-                    content, title = await asyncio.get_running_loop().run_in_executor(
-                        self.worker_pool.executor, scraper.scrape
-                    )
-
-                # Check content length and log result
-                if not content or len(content) < 100:
-                    reason = "Content too short or empty"
-                    if not content:
-                        reason = "No content retrieved"
-                    elif len(content) < 100:
-                        reason = f"Content too short ({len(content)} characters)"
-                    
-                    self.logger.warning(f"{reason} for {link}")
-                    
-                    # Log to websocket
-                    if self.websocket:
-                        try:
-                            await self.websocket.send_json({
-                                "type": "source_update",
-                                "url": link,
-                                "used": False,
-                                "skip_reason": reason,
-                                "title": title,
-                                "content_length": len(content) if content else 0
-                            })
-                        except Exception as e:
-                            self.logger.warning(f"Error sending websocket update: {e}")
-                    
-                    return {
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                # Only propagate our own cancellation; when the scrape we waited on was
+                # cancelled with its owner, look the link up again and scrape it ourselves
+                if asyncio.current_task().cancelling():
+                    raise
+                return await self.extract_data_from_url(link, session)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await self._extract_data_from_url(link, session)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting on it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+    async def _extract_data_from_url(self, link, session):
+        try:
+            # Log scraping attempt
+            self._emit({
+                "type": "logs",
+                "content": "scraping",
+                "output": f"🔍 Scraping: {link}"
+            })
+            
+            Scraper = self.get_scraper(link)
+
+            # Get content, repeat URLs are served from the cache without a fetch
+            cached = await scrape_cache.get(link)
+            if cached is None and Scraper is BeautifulSoupScraper:
+                # Check type and size from the headers before downloading the body
+                async with self.worker_pool.throttle():
+                    Scraper, skip_reason = await self._probe(link, session)
+                if skip_reason:
+                    self.logger.warning("%s for %s", skip_reason, link)
+                    self._emit({
+                        "type": "source_update",
                         "url": link,
-                        "raw_content": None,
-                        "title": title,
-                    }
-
-                # Log successful scraping
-                self.logger.info(f"\nTitle: {title}")
-                self.logger.info(
-                    f"Content length: {len(content) if content else 0} characters"
-                )
-                self.logger.info(f"URL: {link}")
-                self.logger.info("=" * 50)
-
-                # Log success to websocket
-                if self.websocket:
-                    try:
-                        await self.websocket.send_json({
-                            "type": "source_update",
-                            "url": link,
-                            "used": True,
-                            "skip_reason": "",
-                            "title": title,
-                            "content_length": len(content)
-                        })
-                        
-                        await self.websocket.send_json({
-                            "type": "logs",
-                            "content": "scraping_success",
-                            "output": f"✅ Successfully scraped: {link} ({len(content)} chars)"
-                        })
-                    except Exception as e:
-                        self.logger.warning(f"Error sending websocket update: {e}")
+                        "used": False,
+                        "skip_reason": skip_reason,
+                        "title": "",
+                        "content_length": 0
+                    })
+                    return {"url": link, "raw_content": None, "title": ""}
 
+            scraper = Scraper(link, session)
+
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("\n=== Using %s for %s ===", scraper.__class__.__name__, link)
+
+            if cached is not None:
+                content, title = cached
+            else:
+                # Only the fetch and parse count against the worker limit
+                async with self.worker_pool.throttle():
+                    if hasattr(scraper, "scrape_async"):
+                        # Download on the loop, parse HTML and PDFs outside the GIL
+                        content, title = await scraper.scrape_async(self.worker_pool.process_pool)
+                    else:
+                        content, title = await asyncio.get_running_loop().run_in_executor(
+                            self.worker_pool.executor, scraper.scrape
+                        )
+
+            # Check content length and log result
+            if not content or len(content) < 100:
+                reason = "Content too short or empty"
+                if not content:
+                    reason = "No content retrieved"
+                elif len(content) < 100:
+                    reason = f"Content too short ({len(content)} characters)"
+                
+                self.logger.warning("%s for %s", reason, link)
+                
+                # Log to websocket
+                self._emit({
+                    "type": "source_update",
+                    "url": link,
+                    "used": False,
+                    "skip_reason": reason,
+                    "title": title,
+                    "content_length": len(content) if content else 0
+                })
+                
                 return {
                     "url": link,
-                    "raw_content": content,
+                    "raw_content": None,
                     "title": title,
                 }
 
-            except Exception as e:
-                error_msg = f"Error processing {link}: {str(e)}"
-                self.logger.error(error_msg)
-                
-                # Log error to websocket
-                if self.websocket:
-                    try:
-                        await self.websocket.send_json({
-                            "type": "source_update",
-                            "url": link,
-                            "used": False,
-                            "skip_reason": f"Scraping error: {str(e)}",
-                            "title": "",
-                            "content_length": 0
-                        })
-                        
-                        await self.websocket.send_json({
-                            "type": "logs",
-                            "content": "scraping_error",
-                            "output": f"❌ Failed to scrape: {link} - {str(e)}"
-                        })
-                    except Exception as ws_error:
-                        self.logger.warning(f"Error sending websocket update: {ws_error}")
-                
-                return {"url": link, "raw_content": None, "title": ""}
+            if cached is None:
+                await scrape_cache.set(
+                    link, content, title,
+                    etag=getattr(scraper, "etag", None),
+                    last_modified=getattr(scraper, "last_modified", None),
+                )
+
+            # Log successful scraping
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("\nTitle: %s", title)
+                self.logger.info("Content length: %d characters", len(content))
+                self.logger.info("URL: %s", link)
+                self.logger.info(_LOG_SEPARATOR)
+
+            # Log success to websocket
+            self._emit({
+                "type": "source_update",
+                "url": link,
+                "used": True,
+                "skip_reason": "",
+                "title": title,
+                "content_length": len(content)
+            })
+            self._emit({
+                "type": "logs",
+                "content": "scraping_success",
+                "output": f"✅ Successfully scraped: {link} ({len(content)} chars)"
+            })
+
+            return {
+                "url": link,
+                "raw_content": content,
+                "title": title,
+            }
+
+        except Exception as e:
+            error_msg = f"Error processing {link}: {str(e)}"
+            self.logger.error(error_msg)
+            
+            # Log error to websocket
+            self._emit({
+                "type": "source_update",
+                "url": link,
+                "used": False,
+                "skip_reason": f"Scraping error: {str(e)}",
+                "title": "",
+                "content_length": 0
+            })
+            self._emit({
+                "type": "logs",
+                "content": "scraping_error",
+                "output": f"❌ Failed to scrape: {link} - {str(e)}"
+            })
+            
+            return {"url": link, "raw_content": None, "title": ""}
+
+    async def _probe(self, link, session):
+        """
+        Send a HEAD request to learn the page type and size before the full GET.
+        Returns the scraper class to use and a skip reason, or None. Servers that reject
+        HEAD or omit the headers get the benefit of the doubt.
+        """
+        try:
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=4, sock_read=4)
+            async with session.head(link, allow_redirects=True, timeout=timeout) as response:
+                if response.status >= 400:
+                    return BeautifulSoupScraper, None
+                content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+                content_length = int(response.headers.get("Content-Length") or 0)
+        except Exception:
+            return BeautifulSoupScraper, None
+
+        if content_length > self.max_page_bytes:
+            return BeautifulSoupScraper, f"Page too large ({content_length} bytes)"
+        if content_type == _PDF_CONTENT_TYPE:
+            return PyMuPDFScraper, None
+        if content_type and content_type not in _HTML_CONTENT_TYPES:
+            return BeautifulSoupScraper, f"Unsupported content type ({content_type})"
+        return BeautifulSoupScraper, None
 
     def get_scraper(self, link):
         """
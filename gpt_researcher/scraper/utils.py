@@ -1,48 +1,48 @@
-from bs4 import BeautifulSoup
-import bs4
-import logging
-import re
-
-def extract_title(soup: BeautifulSoup) -> str:
-    """Extract the title from the BeautifulSoup object"""
-    return soup.title.string if soup.title else ""
-
-def clean_soup(soup: BeautifulSoup) -> BeautifulSoup:
-    """Clean the soup by removing unwanted tags"""
-    for tag in soup.find_all(
-        [
-            "script",
-            "style",
-            "footer",
-            "header",
-            "nav",
-            "menu",
-            "sidebar",
-            "svg",
-        ]
-    ):
-        tag.decompose()
-
-    disallowed_class_set = {"nav", "menu", "sidebar", "footer"}
-
-    # clean tags with certain classes
-    def does_tag_have_disallowed_class(elem) -> bool:
-        if not isinstance(elem, bs4.Tag):
-            return False
-
-        return any(
-            cls_name in disallowed_class_set for cls_name in elem.get("class", [])
-        )
-
-    for tag in soup.find_all(does_tag_have_disallowed_class):
-        tag.decompose()
-
-    return soup
-
-
-def get_text_from_soup(soup: BeautifulSoup) -> str:
-    """Get the relevant text from the soup with improved filtering"""
-    text = soup.get_text(strip=True, separator="\n")
-    # Remove excess whitespace
-    text = re.sub(r"\s{2,}", " ", text)
-    return text
\ No newline at end of file
+import lxml.html
+from lxml import etree
+
+# Tags whose whole subtree is noise for research content
+_UNWANTED_TAGS = frozenset({"script", "style", "footer", "header", "nav", "menu", "sidebar", "svg"})
+_DISALLOWED_CLASSES = frozenset({"nav", "menu", "sidebar", "footer"})
+
+
+def parse_html(body: bytes, encoding: str | None = None) -> lxml.html.HtmlElement:
+    """Parse a page with lxml's C parser, honouring the response charset when known"""
+    try:
+        parser = lxml.html.HTMLParser(encoding=encoding, remove_blank_text=True)
+    except LookupError:
+        parser = lxml.html.HTMLParser(remove_blank_text=True)
+    return lxml.html.document_fromstring(body, parser=parser)
+
+
+def _is_unwanted(element) -> bool:
+    if element.tag in _UNWANTED_TAGS:
+        return True
+    classes = element.get("class")
+    return bool(classes) and not _DISALLOWED_CLASSES.isdisjoint(classes.split())
+
+
+def parse_page(body: bytes, encoding: str | None = None) -> tuple[str, str]:
+    """
+    Extract (title, text) from a page in a single walk over the tree.
+    Unwanted tags and classes are skipped with their subtree instead of being removed first.
+    """
+    root = parse_html(body, encoding)
+    title = None
+    pieces = []
+    walker = etree.iterwalk(root, events=("start", "end", "comment", "pi"))
+    for event, element in walker:
+        if event == "start":
+            if _is_unwanted(element):
+                walker.skip_subtree()
+                continue
+            if title is None and element.tag == "title":
+                title = element.text or ""
+            if element.text:
+                pieces.append(element.text)
+        # The tail is text of the parent, kept even when the element itself is skipped
+        elif element.tail:
+            pieces.append(element.tail)
+
+    # str.split collapses all whitespace runs in C, no regex pass needed
+    return title or "", " ".join(" ".join(pieces).split())
@@ -1,7 +1,14 @@
+import asyncio
+
+import aiohttp
+
 from gpt_researcher.utils.workers import WorkerPool
 
 from ..actions.utils import stream_output
-from ..actions.web_scraping import scrape_urls
+from ..actions.web_scraping import filter_urls, scrape_urls
+from ..scraper.cache import canonicalize_url
+from ..scraper.dedup import drop_near_duplicates
+from ..scraper.scraper import create_http_session
 
 
 class BrowserManager:
@@ -10,6 +17,29 @@ class BrowserManager:
     def __init__(self, researcher):
         self.researcher = researcher
         self.worker_pool = WorkerPool(researcher.cfg.max_scraper_workers)
+        # Kept across browse_urls calls so repeat hosts reuse keep-alive connections
+        self.http_session: aiohttp.ClientSession | None = None
+        # Canonical URLs scraped successfully during this research session
+        self.scraped_urls: set[str] = set()
+        # Scrapes in progress by canonical URL; researchers running side by side
+        # can share one map so a URL they all request is fetched once
+        self.in_flight: dict[str, asyncio.Future] = {}
+
+    def get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared scraping session, creating it on first use."""
+        if self.http_session is None or self.http_session.closed:
+            self.http_session = create_http_session(
+                self.researcher.cfg.user_agent,
+                self.researcher.cfg.max_scraper_workers,
+                keepalive_timeout=60,
+            )
+        return self.http_session
+
+    async def aclose(self):
+        """Close the shared scraping session."""
+        if self.http_session is not None:
+            await self.http_session.close()
+            self.http_session = None
 
     async def browse_urls(self, urls: list[str]) -> list[dict]:
         """
@@ -21,6 +51,8 @@ class BrowserManager:
         Returns:
             list[dict]: list of scraped content results.
         """
+        urls = await filter_urls(urls, self.researcher.cfg, seen=self.scraped_urls)
+
         if self.researcher.verbose:
             await stream_output(
                 "logs",
@@ -34,10 +66,25 @@ class BrowserManager:
             urls, 
             self.researcher.cfg, 
             self.worker_pool,
-            websocket=self.researcher.websocket  # <- ADD THIS LINE
+            websocket=self.researcher.websocket,  # <- ADD THIS LINE
+            session=self.get_http_session(),
+            in_flight=self.in_flight,
         )
         # ================================================================
-        
+        self.scraped_urls.update(canonicalize_url(item["url"]) for item in scraped_content)
+
+        # Mirrors and syndicated copies would only repeat the same context
+        scraped_content, duplicates, _ = await drop_near_duplicates(
+            scraped_content, executor=self.worker_pool.process_pool
+        )
+        if duplicates and self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "scraping_duplicates",
+                f"🧹 Skipped {len(duplicates)} near-duplicate pages",
+                self.researcher.websocket,
+            )
+
         self.researcher.add_research_sources(scraped_content)
 
         if self.researcher.verbose:
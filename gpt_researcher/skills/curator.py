@@ -4,6 +4,44 @@ from ..config.config import Config
 from ..utils.llm import create_chat_completion
 from ..actions import stream_output
 
+# Characters of each source shown to the curator LLM, full documents are restored by URL
+SNIPPET_CHARS = 2000
+# Completion budget per source: the echoed snippet (~4 chars per token) plus url and title
+TOKENS_PER_SOURCE = SNIPPET_CHARS // 4 + 100
+MAX_CURATOR_TOKENS = 8000
+
+
+def parse_sources_list(response: str) -> list:
+    """
+    Parse the curator's JSON list of sources. A response cut off by the token limit still
+    yields every source completed before the cut instead of failing as a whole.
+    """
+    try:
+        return json.loads(response)
+    except json.JSONDecodeError as e:
+        error = e
+
+    start = response.find("[")
+    if start == -1:
+        raise error
+    decoder = json.JSONDecoder()
+    sources = []
+    pos = start + 1
+    while True:
+        while pos < len(response) and response[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(response) or response[pos] == "]":
+            break
+        try:
+            source, pos = decoder.raw_decode(response, pos)
+        except json.JSONDecodeError:
+            break
+        sources.append(source)
+
+    if not sources:
+        raise error
+    return sources
+
 
 class SourceCurator:
     """Ranks sources and curates data based on their relevance, credibility and reliability."""
@@ -11,6 +49,18 @@ class SourceCurator:
     def __init__(self, researcher):
         self.researcher = researcher
 
+    @staticmethod
+    def _compact(item):
+        """URL, title and a leading snippet of a source, other items are passed through"""
+        if not isinstance(item, dict) or not item.get('url'):
+            return item
+        content = item.get('raw_content') or item.get('content') or ''
+        return {
+            'url': item['url'],
+            'title': item.get('title', ''),
+            'snippet': content[:SNIPPET_CHARS],
+        }
+
     async def curate_sources(
         self,
         source_data: List,
@@ -42,22 +92,36 @@ class SourceCurator:
         try:
             # Create a mapping of URLs from source_data for tracking
             url_to_source = {item.get('url'): item for item in source_data if isinstance(item, dict) and item.get('url')}
+
+            # The LLM only needs enough of each source to judge it, not the whole page
+            if isinstance(source_data, list):
+                compact_sources = [self._compact(item) for item in source_data]
+            else:
+                compact_sources = source_data
+
+            # Small source lists do not need the full completion budget
+            max_tokens = MAX_CURATOR_TOKENS
+            if isinstance(source_data, list):
+                max_tokens = min(MAX_CURATOR_TOKENS, TOKENS_PER_SOURCE * max(len(source_data), 1))
             
             response = await create_chat_completion(
                 model=self.researcher.cfg.smart_llm_model,
                 messages=[
                     {"role": "system", "content": f"{self.researcher.role}"},
                     {"role": "user", "content": self.researcher.prompt_family.curate_sources(
-                        self.researcher.query, source_data, max_results)},
+                        self.researcher.query, compact_sources, max_results)},
                 ],
                 temperature=0.2,
-                max_tokens=8000,
+                max_tokens=max_tokens,
                 llm_provider=self.researcher.cfg.smart_llm_provider,
                 llm_kwargs=self.researcher.cfg.llm_kwargs,
                 cost_callback=self.researcher.add_costs,
             )
 
-            curated_sources = json.loads(response)
+            curated_sources = [
+                url_to_source.get(source.get('url'), source) if isinstance(source, dict) else source
+                for source in parse_sources_list(response)
+            ]
             print(f"\n\nFinal Curated sources {len(curated_sources)} sources: {curated_sources}")
 
             # Create set of kept URLs for easy lookup
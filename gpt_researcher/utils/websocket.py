@@ -0,0 +1,16 @@
+from typing import Any, Dict
+
+import orjson
+
+
+async def send_json(websocket: Any, data: Dict[str, Any]) -> None:
+    """
+    Send JSON through a websocket, encoded with orjson instead of the stdlib encoder.
+    Real sockets get a text frame so the browser still parses `event.data` as a string;
+    log handlers and other targets that only implement `send_json` get the dict as is.
+    """
+    send_text = getattr(websocket, "send_text", None)
+    if send_text is None:
+        await websocket.send_json(data)
+        return
+    await send_text(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode())
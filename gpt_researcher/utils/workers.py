@@ -1,13 +1,51 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
+_process_pool: ProcessPoolExecutor | None = None
+
+# Parsing runs next to the render pool in the same server, so it does not take every core
+MAX_PROCESS_WORKERS = 4
+
+
+def _mp_context():
+    # The pool may first be needed from a process that already runs threads, where a
+    # plain fork can copy a held lock into the worker and deadlock it
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Returns the shared process pool for CPU-bound page parsing, creating it if needed."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=min(MAX_PROCESS_WORKERS, os.cpu_count() or 1),
+            mp_context=_mp_context(),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Stops the parsing worker processes."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
 
 class WorkerPool:
     def __init__(self, max_workers: int):
         self.max_workers = max_workers
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.semaphore = asyncio.Semaphore(max_workers)
+        self.semaphore = asyncio.BoundedSemaphore(max_workers)
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        # Shared by every WorkerPool so researchers do not each spawn cpu_count processes
+        return get_process_pool()
 
     @asynccontextmanager
     async def throttle(self):
@@ -38,4 +38,20 @@ if __name__ == "__main__":
     port = int(os.environ.get('PORT', 3001))
     
     logger.info(f"Starting server on port {port}...")
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    from backend.server.ws_protocol import NoContextTakeoverWebSocketProtocol
+
+    # uvloop is not available on Windows, fall back to the stock asyncio loop there
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        loop=loop,
+        ws=NoContextTakeoverWebSocketProtocol,
+        ws_per_message_deflate=True,
+    )
\ No newline at end of file